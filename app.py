@@ -5,11 +5,19 @@ A tool for monitoring CAN bus communications with different UI options.
 This is the unified entry point for both CLI and GUI modes.
 """
 
+import os
+import re
 import sys
 import logging
 import argparse
+import importlib.util
 from typing import Optional
 
+__version__ = "0.1.0"
+
+# Separator between "key=value" pairs in --details/--message strings
+_KV_SEPARATOR_RE = re.compile(r"\s*;\s*")
+
 def setup_logging(level: int = logging.INFO) -> None:
     """Set up logging for the application."""
     logging.basicConfig(
@@ -53,23 +61,22 @@ def parse_arguments() -> argparse.Namespace:
     debug_group = parser.add_argument_group('Debug Options')
     debug_group.add_argument('--debug', action='store_true',
                            help='Enable debug logging')
+    parser.add_argument('--version', action='version', version=f'%(prog)s {__version__}')
     
     return parser.parse_args()
 
+def _parse_kv(text: str) -> dict:
+    """Parse a "key=value;key=value" CLI string into a dictionary."""
+    pairs = (part.split("=", 1) for part in _KV_SEPARATOR_RE.split(text.strip()) if part)
+    return {key.strip(): value.strip() for key, value in pairs}
+
 def run_cli_mode(args: argparse.Namespace) -> None:
     """Run the application in CLI mode."""
-    # Import core modules for CLI mode
-    from core.can_interface import CANInterface
-    from core.filter_manager import FilterManager
-    from core.message_manager import MessageManager
-    from core.utils import parse_value
-    # Import remote classes from controllers
-    from controllers.frameworks.pyqt.remote_controller import RemoteServer, RemoteClient
-    from PyQt6.QtCore import QCoreApplication
-    
-    """Handles CLI actions."""
+    # Each branch imports only what it needs, so local actions never load Qt
     # Local actions: add_filter, remove_filter, send_message
     if args.action in ["add_filter", "remove_filter", "send_message"]:
+        from core.can_interface import CANInterface
+
         # Instantiate and connect the CAN interface using CLI options
         can_interface = CANInterface()
         channel = args.channel if args.channel else "can0"
@@ -81,16 +88,13 @@ def run_cli_mode(args: argparse.Namespace) -> None:
         if not can_interface.connect(channel, bitrate):
             logging.error("Failed to connect to CAN interface.")
             sys.exit(1)
-        # Instantiate managers for filters and messages
-        filter_manager = FilterManager()
-        message_manager = MessageManager()
 
         if args.action == "add_filter":
+            from core.filter_manager import FilterManager
+
+            filter_manager = FilterManager()
             try:
-                details_dict = {}
-                for part in args.details.split(";"):
-                    key, value = part.split("=")
-                    details_dict[key.strip()] = value.strip()
+                details_dict = _parse_kv(args.details)
                 filter_id = details_dict["id"]
                 mask = details_dict["mask"]
                 if filter_manager.add_filter(filter_id, mask):
@@ -101,16 +105,15 @@ def run_cli_mode(args: argparse.Namespace) -> None:
                 logging.error(f"Error parsing details for add_filter: {e}")
 
         elif args.action == "remove_filter":
+            from core.filter_manager import FilterManager
+
+            filter_manager = FilterManager()
             try:
-                details_dict = {}
-                for part in args.details.split(";"):
-                    key, value = part.split("=")
-                    details_dict[key.strip()] = value.strip()
+                details_dict = _parse_kv(args.details)
                 filter_id = details_dict["id"]
                 mask_str = details_dict["mask"]
-                # Convert the mask string to a list of integers
-                mask_list = [parse_value(b) for b in mask_str.split()]
-                if filter_manager.remove_filter(filter_id, mask_list):
+                # FilterManager parses the space-separated mask string itself
+                if filter_manager.remove_filter(filter_id, mask_str):
                     logging.info("Filter removed successfully via CLI.")
                 else:
                     logging.error("Failed to remove filter.")
@@ -118,11 +121,11 @@ def run_cli_mode(args: argparse.Namespace) -> None:
                 logging.error(f"Error parsing details for remove_filter: {e}")
 
         elif args.action == "send_message":
+            from core.message_manager import MessageManager
+
+            message_manager = MessageManager()
             try:
-                msg_dict = {}
-                for part in args.message.split(";"):
-                    key, value = part.split("=")
-                    msg_dict[key.strip()] = value.strip()
+                msg_dict = _parse_kv(args.message)
                 message_id = msg_dict["id"]
                 data_str = msg_dict["data"]
                 if message_manager.add_message("cli", message_id, data_str):
@@ -139,11 +142,11 @@ def run_cli_mode(args: argparse.Namespace) -> None:
 
     # Remote server mode: start a server that listens for client commands and broadcasts CAN messages
     elif args.action == "start_server":
+        from core.can_interface import CANInterface
+        from core.remote import RemoteServer
+
         try:
-            details_dict = {}
-            for part in args.details.split(";"):
-                key, value = part.split("=")
-                details_dict[key.strip()] = value.strip()
+            details_dict = _parse_kv(args.details)
             port = int(details_dict.get("port", 5000))
             can_interface = CANInterface()
             channel = args.channel if args.channel else "can0"
@@ -158,14 +161,15 @@ def run_cli_mode(args: argparse.Namespace) -> None:
             server = RemoteServer(port, can_interface)
             server.start()
             logging.info("Remote server started. Press Ctrl+C to stop.")
-            try:
-                # In a real implementation you would integrate CAN message polling and broadcasting here.
-                # For now, simply sleep until interrupted.
-                import time
-                while True:
-                    time.sleep(1)
-            except KeyboardInterrupt:
-                logging.info("Shutting down server...")
+            # In a real implementation you would integrate CAN message polling and broadcasting here.
+            # For now, block without periodic wakeups until Ctrl+C or SIGTERM.
+            import signal
+            import threading
+            stop_event = threading.Event()
+            signal.signal(signal.SIGINT, lambda signum, frame: stop_event.set())
+            signal.signal(signal.SIGTERM, lambda signum, frame: stop_event.set())
+            stop_event.wait()
+            logging.info("Shutting down server...")
             server.stop()
             can_interface.disconnect()
         except Exception as e:
@@ -173,24 +177,29 @@ def run_cli_mode(args: argparse.Namespace) -> None:
 
     # Remote client mode: connect to a remote server and print received messages
     elif args.action == "connect_client":
+        from core.remote import RemoteConnection
+        from core.remote_protocol import row_to_message, unpack_rows
+
         try:
-            details_dict = {}
-            for part in args.details.split(";"):
-                key, value = part.split("=")
-                details_dict[key.strip()] = value.strip()
+            details_dict = _parse_kv(args.details)
             ip = details_dict.get("ip")
             port = int(details_dict.get("port", 5000))
-            # QCoreApplication is used here for a minimal event loop to run QThread-based RemoteClient
-            app = QCoreApplication([])
-            client = RemoteClient(ip, port)
 
             def print_message(msg):
-                print("Received remote message:", msg)
+                for row in unpack_rows(msg):
+                    print("Received remote message:", row_to_message(row))
 
-            client.message_received.connect(print_message)
+            # Messages are printed on the network reactor thread; no Qt event loop is needed
+            client = RemoteConnection(ip, port, print_message)
             client.start()
             logging.info("Remote client connected. Press Ctrl+C to exit.")
-            app.exec()
+            import signal
+            import threading
+            stop_event = threading.Event()
+            signal.signal(signal.SIGINT, lambda signum, frame: stop_event.set())
+            signal.signal(signal.SIGTERM, lambda signum, frame: stop_event.set())
+            stop_event.wait()
+            client.disconnect()
         except Exception as e:
             logging.error(f"Error connecting as client: {e}")
     else:
@@ -200,7 +209,6 @@ def run_cli_mode(args: argparse.Namespace) -> None:
 def run_gui_mode(args: argparse.Namespace) -> None:
     """Run the application in GUI mode."""
     # Fix for high DPI displays
-    import os
     os.environ["QT_FONT_DPI"] = "96"
     
     # Determine which UI to use based on arguments and availability
@@ -211,13 +219,9 @@ def run_gui_mode(args: argparse.Namespace) -> None:
     if not args.modern and not args.classic:
         use_modern = True
     
-    # Auto-detect UI framework if needed
+    # Auto-detect UI framework if needed; find_spec checks availability without importing it
     if ui_framework == 'auto':
-        try:
-            import PySide6
-            ui_framework = 'pyside'
-        except ImportError:
-            ui_framework = 'pyqt'
+        ui_framework = 'pyside' if importlib.util.find_spec("PySide6") else 'pyqt'
     
     # Import the appropriate UI modules and start the application
     if ui_framework == 'pyside':
@@ -271,6 +275,11 @@ def run_gui_mode(args: argparse.Namespace) -> None:
 
 def main() -> None:
     """Main entry point for the application."""
+    # Fast path: answer --version without building the parser or importing anything else
+    if "--version" in sys.argv[1:]:
+        print(f"{os.path.basename(sys.argv[0])} {__version__}")
+        sys.exit(0)
+
     args = parse_arguments()
     
     # Setup logging
@@ -0,0 +1,43 @@
+import logging
+from core.can_interface import CANInterface
+
+logger = logging.getLogger(__name__)
+
+
+class CANControllerCore:
+    """
+    Framework-agnostic CAN connection logic shared by the Qt CAN controllers.
+    Importing this module does not load any Qt bindings.
+    """
+
+    def __init__(self):
+        self.can_interface = CANInterface()
+
+    def is_connected(self) -> bool:
+        return self.can_interface.is_connected()
+
+    def disconnect(self) -> bool:
+        return self.can_interface.disconnect()
+
+    def connect(self, channel: str, bitrate_str: str) -> bool:
+        """
+        Validates the connection settings, connects to the CAN interface and
+        starts receiving messages.
+
+        Returns:
+            bool: True if connected, False if the interface refused the connection.
+
+        Raises:
+            ValueError: If the channel or bitrate is missing or invalid.
+        """
+        if not channel or not bitrate_str:
+            raise ValueError("Channel and bitrate are required to connect.")
+        try:
+            bitrate = int(bitrate_str)
+        except ValueError:
+            raise ValueError("Invalid bitrate. Please enter a valid number.")
+        if not self.can_interface.connect(channel, bitrate):
+            return False
+        self.can_interface.start_receiving()
+        logger.info("Connected to CAN channel '%s' at %d bitrate.", channel, bitrate)
+        return True
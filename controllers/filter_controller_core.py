@@ -0,0 +1,54 @@
+from core.filter_manager import FilterManager
+from core.utils import parse_value, parse_bytes, HEX_BYTE, HEX_ID
+
+
+def parse_filter_inputs(filter_id: str, filter_bytes: list) -> tuple:
+    """
+    Parses and validates a filter ID and its mask bytes, rendering the
+    table text for the filter in the same pass.
+
+    Args:
+        filter_id (str): The filter ID in hex, binary, or decimal format.
+        filter_bytes (list[str]): The mask byte strings; empty fields become 0.
+
+    Returns:
+        tuple: The parsed ID (int), the parsed mask (bytes) and the
+        display strings for the ID and each mask byte (tuple[str]).
+
+    Raises:
+        ValueError: If the ID or any byte is invalid or out of range.
+    """
+    parsed_id = parse_value(filter_id)
+    if not (0 <= parsed_id <= 0x7FF):
+        raise ValueError(f"Invalid Filter ID: {parsed_id}")
+    # Parse each byte; empty fields become 0
+    parsed_bytes = parse_bytes([byte or "0" for byte in filter_bytes])
+    cells = (HEX_ID[parsed_id],) + tuple(HEX_BYTE[b] for b in parsed_bytes)
+    return parsed_id, parsed_bytes, cells
+
+
+class FilterControllerCore:
+    """
+    Framework-agnostic filter logic shared by the Qt filter controllers.
+    Importing this module does not load any Qt bindings.
+    """
+
+    def __init__(self):
+        self.filter_manager = FilterManager()
+
+    def add_filter_from_inputs(self, filter_id: str, filter_bytes: list):
+        """
+        Validates raw input strings and adds the resulting filter.
+
+        Returns:
+            tuple | None: The stored filter (dict) and the new row's display strings (tuple[str])
+                if added, None if it is a duplicate.
+
+        Raises:
+            ValueError: If the inputs are invalid.
+        """
+        parsed_id, parsed_bytes, cells = parse_filter_inputs(filter_id, filter_bytes)
+        added = self.filter_manager.add_filter_parsed(parsed_id, parsed_bytes)
+        if added is None:
+            return None
+        return added, cells
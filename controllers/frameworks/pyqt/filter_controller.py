@@ -1,24 +1,41 @@
 import logging
+from contextlib import contextmanager
 from PyQt6.QtWidgets import QTableWidgetItem, QLineEdit, QPushButton, QTableWidget
-from PyQt6.QtCore import Qt
-from core.filter_manager import FilterManager
-from core.utils import parse_value
+from PyQt6.QtCore import Qt, QObject, QTimer, pyqtSlot
+from controllers.filter_controller_core import FilterControllerCore
+from controllers.widgets import bind_widgets, rows_in_selection
+from core.utils import HEX_BYTE, HEX_ID
 
-class FilterController:
+logger = logging.getLogger(__name__)
+
+class FilterController(FilterControllerCore):
     def __init__(self, main_window):
+        super().__init__()
         self.main_window = main_window
-        self.filter_manager = FilterManager()
+        # Filter shown on each row, keyed by the int handle stored in the row's UserRole
+        self._filters_by_handle = {}
+        self._next_handle = 0
+        # Rows with edits waiting to be applied in one pass
+        self._pending_edit_rows = set()
         self.init_widgets()
         self.setup_table()
 
     def init_widgets(self):
         """Initialize filter-related widgets and connect signals."""
-        self.filters_table: QTableWidget = self.main_window.findChild(QTableWidget, "tableFilters")
-        self.filter_id_input: QLineEdit = self.main_window.findChild(QLineEdit, "inputFilterId")
-        self.filter_byte_inputs = [self.main_window.findChild(QLineEdit, f"inputFilterByte{i}") for i in range(8)]
-        self.add_filter_button: QPushButton = self.main_window.findChild(QPushButton, "buttonAddFilter")
-        self.remove_filter_button: QPushButton = self.main_window.findChild(QPushButton, "buttonRemoveFilter")
-        self.clear_filters_button: QPushButton = self.main_window.findChild(QPushButton, "buttonClearFilters")
+        widgets = bind_widgets(self.main_window, {
+            "tableFilters": QTableWidget,
+            "inputFilterId": QLineEdit,
+            **{f"inputFilterByte{i}": QLineEdit for i in range(8)},
+            "buttonAddFilter": QPushButton,
+            "buttonRemoveFilter": QPushButton,
+            "buttonClearFilters": QPushButton,
+        }, QObject)
+        self.filters_table: QTableWidget = widgets["tableFilters"]
+        self.filter_id_input: QLineEdit = widgets["inputFilterId"]
+        self.filter_byte_inputs = [widgets[f"inputFilterByte{i}"] for i in range(8)]
+        self.add_filter_button: QPushButton = widgets["buttonAddFilter"]
+        self.remove_filter_button: QPushButton = widgets["buttonRemoveFilter"]
+        self.clear_filters_button: QPushButton = widgets["buttonClearFilters"]
 
         # Connect filter buttons to handlers
         self.add_filter_button.clicked.connect(self.handle_add_filter)
@@ -32,24 +49,75 @@ class FilterController:
         self.filters_table.setHorizontalHeaderLabels(["Filter ID"] + [f"Byte {i}" for i in range(8)])
         self.filters_table.setEditTriggers(self.filters_table.EditTrigger.AllEditTriggers)
 
-    def update_filters_table(self):
-        """Updates the filters table with the latest filters."""
+    @contextmanager
+    def batched_table_update(self):
+        """Suspends signals, repaints and sorting while the filters table is mutated."""
+        sorting_enabled = self.filters_table.isSortingEnabled()
+        self.filters_table.setSortingEnabled(False)
+        self.filters_table.setUpdatesEnabled(False)
         self.filters_table.blockSignals(True)
-        self.filters_table.setRowCount(0)
-        filters = self.filter_manager.get_filters()
-
-        for row_index, f in enumerate(filters):
-            self.filters_table.insertRow(row_index)
-            item_id = QTableWidgetItem(hex(f['id']))
-            # Store the entire filter dictionary in UserRole so we can refer back to it later
-            item_id.setData(Qt.ItemDataRole.UserRole, f)
-            self.filters_table.setItem(row_index, 0, item_id)
-            for col_index, byte_value in enumerate(f['mask']):
-                self.filters_table.setItem(row_index, col_index + 1, QTableWidgetItem(hex(byte_value)))
-
-        self.filters_table.blockSignals(False)
-        logging.info("Filters table updated.")
+        try:
+            yield
+        finally:
+            self.filters_table.blockSignals(False)
+            self.filters_table.setUpdatesEnabled(True)
+            self.filters_table.setSortingEnabled(sorting_enabled)
+
+    def _fill_row(self, row, f, cells=None):
+        """Writes a filter into the given row and registers a fresh handle for it."""
+        # Filters in this manager are range-checked on add and edit, so the hex tables always apply
+        if cells is None:
+            cells = (HEX_ID[f['id']],) + tuple(HEX_BYTE[b] for b in f['mask'])
+        handle = self._next_handle
+        self._next_handle += 1
+        self._filters_by_handle[handle] = f
+        item_id = QTableWidgetItem(cells[0])
+        # Store an int handle into _filters_by_handle rather than marshalling the whole dict
+        item_id.setData(Qt.ItemDataRole.UserRole, handle)
+        self.filters_table.setItem(row, 0, item_id)
+        for col_index, text in enumerate(cells[1:], 1):
+            self.filters_table.setItem(row, col_index, QTableWidgetItem(text))
+
+    def _filter_at(self, row):
+        """Returns the (handle, filter) shown on a row, or (None, None)."""
+        id_item = self.filters_table.item(row, 0)
+        if not id_item:
+            return None, None
+        handle = id_item.data(Qt.ItemDataRole.UserRole)
+        return handle, self._filters_by_handle.get(handle)
+
+    def _append_row(self, f, cells=None):
+        """Appends a single filter row."""
+        row = self.filters_table.rowCount()
+        self.filters_table.insertRow(row)
+        self._fill_row(row, f, cells)
+
+    def _update_row(self, row, f, cells=None):
+        """Replaces the filter shown on one row."""
+        handle, _ = self._filter_at(row)
+        self._filters_by_handle.pop(handle, None)
+        self._fill_row(row, f, cells)
+
+    def _remove_rows(self, rows):
+        """Removes the given rows, highest first so the remaining indices stay valid."""
+        for row in sorted(rows, reverse=True):
+            handle, _ = self._filter_at(row)
+            self._filters_by_handle.pop(handle, None)
+            self.filters_table.removeRow(row)
 
+    def update_filters_table(self):
+        """Rebuilds the filters table from the filter manager (used for clear/reload)."""
+        filters = self.filter_manager.get_filters()
+        with self.batched_table_update():
+            # Size the table once instead of inserting row by row
+            self.filters_table.setRowCount(0)
+            self.filters_table.setRowCount(len(filters))
+            self._filters_by_handle = {}
+            for row_index, f in enumerate(filters):
+                self._fill_row(row_index, f)
+        logger.info("Filters table updated.")
+
+    @pyqtSlot()
     def handle_add_filter(self):
         """Handles adding a new filter."""
         filter_id = self.filter_id_input.text().strip()
@@ -60,24 +128,11 @@ class FilterController:
             return
 
         try:
-            parsed_id = parse_value(filter_id)
-            if not (0 <= parsed_id <= 0x7FF):
-                raise ValueError(f"Invalid Filter ID: {parsed_id}")
-            # Parse each byte; empty fields become 0
-            parsed_bytes = []
-            for i, byte in enumerate(filter_bytes):
-                if byte:
-                    parsed_byte = parse_value(byte)
-                    if not (0 <= parsed_byte <= 255):
-                        raise ValueError(f"Invalid Byte {i}: {parsed_byte}")
-                    parsed_bytes.append(parsed_byte)
-                else:
-                    parsed_bytes.append(0)
-
-            mask = " ".join(hex(b) for b in parsed_bytes)
-            if self.filter_manager.add_filter(hex(parsed_id), mask):
-                logging.info("Filter added successfully.")
-                self.update_filters_table()
+            added = self.add_filter_from_inputs(filter_id, filter_bytes)
+            if added:
+                logger.info("Filter added successfully.")
+                with self.batched_table_update():
+                    self._append_row(*added)
                 self.filter_id_input.clear()
                 for input_field in self.filter_byte_inputs:
                     input_field.clear()
@@ -86,44 +141,66 @@ class FilterController:
         except ValueError as e:
             self.main_window.show_error(str(e))
 
+    @pyqtSlot()
     def handle_remove_filter(self):
         """Handles removing selected filters."""
-        selected_rows = sorted({index.row() for index in self.filters_table.selectedIndexes()}, reverse=True)
+        selected_rows = sorted(rows_in_selection(self.filters_table), reverse=True)
         if not selected_rows:
             self.main_window.show_error("Please select one or more filters to remove.")
             return
 
-        removed_successfully = True
+        removed_rows = []
         for row in selected_rows:
-            filter_id = self.filters_table.item(row, 0).text()
-            mask = [parse_value(self.filters_table.item(row, col).text()) for col in range(1, 9)]
-            if not self.filter_manager.remove_filter(filter_id, mask):
-                logging.warning(f"Failed to remove filter: ID={filter_id}, Mask={mask}")
-                removed_successfully = False
+            _, f = self._filter_at(row)
+            if f and self.filter_manager.remove_filter_parsed(f['id'], f['mask']):
+                removed_rows.append(row)
+            else:
+                logger.warning("Failed to remove filter on row %d: %s", row, f)
 
-        if removed_successfully:
-            self.update_filters_table()
-        else:
+        with self.batched_table_update():
+            self._remove_rows(removed_rows)
+        if len(removed_rows) != len(selected_rows):
             self.main_window.show_error("Failed to remove one or more filters.")
 
+    @pyqtSlot()
     def handle_clear_filters(self):
         """Clears all filters."""
         self.filter_manager.clear_filters()
         self.update_filters_table()
 
+    @pyqtSlot(QTableWidgetItem)
     def handle_edit_filter(self, item):
-        """Handles editing a filter directly in the table."""
-        row = item.row()
-        # Get the original filter from the first column’s stored data
-        id_item = self.filters_table.item(row, 0)
-        if not id_item:
-            return
-        old_filter = id_item.data(Qt.ItemDataRole.UserRole)
-        if not old_filter:
-            return
+        """
+        Handles editing a filter directly in the table.
+        Changes arriving in the same event-loop pass (e.g. several cells of one row)
+        are coalesced so each edited row is applied once.
+        """
+        if not self._pending_edit_rows:
+            QTimer.singleShot(0, self.apply_pending_edits)
+        self._pending_edit_rows.add(item.row())
+
+    def apply_pending_edits(self):
+        """Applies all queued in-table edits, touching only the edited rows."""
+        rows = sorted(self._pending_edit_rows, reverse=True)
+        self._pending_edit_rows.clear()
+        in_sync = True
+        with self.batched_table_update():
+            # Highest rows first, so a row dropped after a failed edit does not shift the others
+            for row in rows:
+                in_sync = self.apply_row_edit(row) and in_sync
+        if not in_sync:
+            self.update_filters_table()
 
-        old_filter_id_str = hex(old_filter['id'])
-        old_mask_str = " ".join(hex(b) for b in old_filter['mask'])
+    def apply_row_edit(self, row):
+        """
+        Replaces the filter shown on the given row with the row's current contents.
+
+        Returns:
+            bool: False if the table no longer matches the filter manager and needs a full rebuild.
+        """
+        _, old_filter = self._filter_at(row)
+        if not old_filter:
+            return False
 
         # Read new values from the entire row
         new_filter_id_text = self.filters_table.item(row, 0).text().strip()
@@ -132,18 +209,26 @@ class FilterController:
             cell_item = self.filters_table.item(row, col)
             cell_text = cell_item.text().strip() if cell_item and cell_item.text().strip() else "0"
             new_mask_list.append(cell_text)
-        new_mask_str = " ".join(new_mask_list)
 
         # Remove the old filter using its original ID and mask
-        if self.filter_manager.remove_filter(old_filter_id_str, old_mask_str):
-            # Add the new filter using the updated values
-            if self.filter_manager.add_filter(new_filter_id_text, new_mask_str):
-                logging.info("Filter updated via in-table edit.")
-            else:
-                self.main_window.show_error("Failed to update filter (duplicate or invalid).")
-        else:
+        if not self.filter_manager.remove_filter_parsed(old_filter['id'], old_filter['mask']):
             self.main_window.show_error("Failed to update filter (old filter removal failed).")
+            return False
 
-        # Refresh the table so that user data is updated
-        self.update_filters_table()
+        # Add the new filter using the updated values, validated like a regular add
+        try:
+            added = self.add_filter_from_inputs(new_filter_id_text, new_mask_list)
+        except ValueError as e:
+            added = None
+            self.main_window.show_error(f"Failed to update filter: {e}")
+        else:
+            if not added:
+                self.main_window.show_error("Failed to update filter (duplicate or invalid).")
 
+        if added:
+            self._update_row(row, *added)
+            logger.info("Filter updated via in-table edit.")
+        else:
+            # The old filter is gone and the new one was rejected, so drop the row
+            self._remove_rows([row])
+        return True
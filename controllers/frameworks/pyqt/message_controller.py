@@ -1,8 +1,148 @@
 import logging
-from PyQt6.QtWidgets import QTableWidgetItem, QLineEdit, QPushButton, QTableWidget
-from PyQt6.QtCore import Qt
+from functools import lru_cache
+from PyQt6.QtWidgets import QLineEdit, QPushButton, QTableView
+from PyQt6.QtCore import Qt, QObject, QAbstractTableModel, QModelIndex, pyqtSlot
+from controllers.widgets import bind_widgets, rows_in_selection
 from core.message_manager import MessageManager
-from core.utils import parse_value
+from core.utils import parse_value, parse_bytes, HEX_BYTE, HEX_ID
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=32)
+def _parse_send_inputs(message_id_text: str, message_bytes: tuple) -> tuple:
+    """
+    Parses the send form's ID and byte fields, memoized so repeated sends of
+    unchanged inputs skip the conversion.
+
+    Returns:
+        tuple: The message ID (int) and the data bytes (tuple[int]).
+
+    Raises:
+        ValueError: If a field is not a valid number.
+    """
+    # Use int(x, 0) so that hex (0x..), binary (0b..), or decimal are supported
+    return int(message_id_text, 0), tuple(int(b, 0) if b else 0 for b in message_bytes)
+
+
+MESSAGE_HEADERS = ("Message Name", "Message ID") + tuple(f"Byte {i}" for i in range(8))
+
+
+class MessagesModel(QAbstractTableModel):
+    """
+    Editable table model that reads straight from a MessageManager's columns.
+    Changes made through the model notify the view for just the affected rows.
+    The message ID and data bytes can be edited in place; names identify rows and are read-only.
+    """
+
+    def __init__(self, manager, parent=None):
+        super().__init__(parent)
+        self._manager = manager
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._manager.names)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(MESSAGE_HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role not in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole) or not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        if column == 0:
+            return self._manager.names[row]
+        # MessageManager range-checks IDs and bytes on add and update, so the hex tables always apply
+        if column == 1:
+            return HEX_ID[self._manager.ids[row]]
+        data = self._manager.data[row]
+        byte_index = column - 2
+        return HEX_BYTE[data[byte_index]] if byte_index < len(data) else ""
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return MESSAGE_HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() > 0:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        """Applies an in-table edit of the ID or a data byte through MessageManager.update_message_parsed."""
+        if role != Qt.ItemDataRole.EditRole or not index.isValid() or index.column() == 0:
+            return False
+        row = index.row()
+        column = index.column()
+        manager = self._manager
+        # Only the edited cell is parsed; the rest of the row comes from the manager's columns.
+        # The row is resubmitted in full, so empty byte cells become 0.
+        message_id = manager.ids[row]
+        data = bytearray(manager.data[row].ljust(len(MESSAGE_HEADERS) - 2, b"\0"))
+        try:
+            parsed = parse_value(str(value).strip() or "0")
+            if column == 1:
+                message_id = parsed
+            else:
+                data[column - 2] = parsed
+        except ValueError as e:
+            logger.error("Error updating message: %s", e)
+            return False
+
+        revision = manager.revision
+        manager.update_message_parsed(manager.names[row], message_id, data)
+        if manager.revision == revision:
+            return False  # Rejected by the manager, which logs why
+        self.dataChanged.emit(self.index(row, 1), self.index(row, len(MESSAGE_HEADERS) - 1))
+        logger.info("Message updated via in-table edit.")
+        return True
+
+    def add_message(self, name, message_id, data) -> bool:
+        """
+        Adds an already-parsed message through the manager and announces the new last row.
+
+        Args:
+            name (str): The name of the message.
+            message_id (int): The message ID.
+            data (bytes | list[int]): The data bytes.
+        """
+        row = len(self._manager.names)
+        if not self._manager.add_message_parsed(name, message_id, data):
+            return False
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.endInsertRows()
+        return True
+
+    def remove_rows(self, rows):
+        """
+        Removes the messages on the given rows. Each contiguous run of rows is announced
+        as one range and removed with a single MessageManager.remove_messages pass,
+        highest run first so the remaining indices stay valid.
+        """
+        rows = sorted(set(rows), reverse=True)
+        names = self._manager.names
+        start = 0
+        while start < len(rows):
+            # Extend the run while the next row is directly above the current one
+            end = start
+            while end + 1 < len(rows) and rows[end + 1] == rows[end] - 1:
+                end += 1
+            first, last = rows[end], rows[start]
+            self.beginRemoveRows(QModelIndex(), first, last)
+            self._manager.remove_messages(names[first:last + 1])
+            names = self._manager.names
+            self.endRemoveRows()
+            start = end + 1
+
+    def clear(self):
+        """Removes every message."""
+        self.beginResetModel()
+        self._manager.clear_messages()
+        self.endResetModel()
+
 
 class MessageController:
     def __init__(self, main_window):
@@ -13,15 +153,26 @@ class MessageController:
 
     def init_widgets(self):
         """Initialize message-related widgets and connect signals."""
-        self.messages_table: QTableWidget = self.main_window.findChild(QTableWidget, "tableMessages")
-        self.message_name_input: QLineEdit = self.main_window.findChild(QLineEdit, "inputMessageName")
-        self.message_id_input: QLineEdit = self.main_window.findChild(QLineEdit, "inputMessageId")
-        self.message_byte_inputs = [self.main_window.findChild(QLineEdit, f"inputMessageByte{i}") for i in range(8)]
-        self.add_message_button: QPushButton = self.main_window.findChild(QPushButton, "buttonAddMessage")
-        self.remove_message_button: QPushButton = self.main_window.findChild(QPushButton, "buttonRemoveMessage")
-        self.clear_messages_button: QPushButton = self.main_window.findChild(QPushButton, "buttonClearMessages")
-        self.send_message_button: QPushButton = self.main_window.findChild(QPushButton, "buttonSendMessage")
-        self.send_selected_button: QPushButton = self.main_window.findChild(QPushButton, "buttonSendSelected")
+        widgets = bind_widgets(self.main_window, {
+            "tableMessages": QTableView,
+            "inputMessageName": QLineEdit,
+            "inputMessageId": QLineEdit,
+            **{f"inputMessageByte{i}": QLineEdit for i in range(8)},
+            "buttonAddMessage": QPushButton,
+            "buttonRemoveMessage": QPushButton,
+            "buttonClearMessages": QPushButton,
+            "buttonSendMessage": QPushButton,
+            "buttonSendSelected": QPushButton,
+        }, QObject)
+        self.messages_table: QTableView = widgets["tableMessages"]
+        self.message_name_input: QLineEdit = widgets["inputMessageName"]
+        self.message_id_input: QLineEdit = widgets["inputMessageId"]
+        self.message_byte_inputs = [widgets[f"inputMessageByte{i}"] for i in range(8)]
+        self.add_message_button: QPushButton = widgets["buttonAddMessage"]
+        self.remove_message_button: QPushButton = widgets["buttonRemoveMessage"]
+        self.clear_messages_button: QPushButton = widgets["buttonClearMessages"]
+        self.send_message_button: QPushButton = widgets["buttonSendMessage"]
+        self.send_selected_button: QPushButton = widgets["buttonSendSelected"]
 
         # Connect message buttons to handlers
         self.add_message_button.clicked.connect(self.handle_add_message)
@@ -29,34 +180,14 @@ class MessageController:
         self.clear_messages_button.clicked.connect(self.handle_clear_messages)
         self.send_message_button.clicked.connect(self.handle_send_message)
         self.send_selected_button.clicked.connect(self.handle_send_selected_message)
-        self.messages_table.itemChanged.connect(self.handle_edit_message)
 
     def setup_table(self):
         """Set up the messages table for in-place editing."""
-        self.messages_table.setColumnCount(10)
-        self.messages_table.setHorizontalHeaderLabels(
-            ["Message Name", "Message ID"] + [f"Byte {i}" for i in range(8)]
-        )
+        self.messages_model = MessagesModel(self.message_manager, parent=self.main_window)
+        self.messages_table.setModel(self.messages_model)
         self.messages_table.setEditTriggers(self.messages_table.EditTrigger.AllEditTriggers)
 
-    def update_messages_table(self):
-        """Updates the messages table with the latest messages."""
-        self.messages_table.blockSignals(True)
-        self.messages_table.setRowCount(0)
-        messages = self.message_manager.get_messages()
-
-        for row_index, msg in enumerate(messages):
-            self.messages_table.insertRow(row_index)
-            item_name = QTableWidgetItem(msg['name'])
-            # Store the complete message dictionary in UserRole for later reference
-            item_name.setData(Qt.ItemDataRole.UserRole, msg)
-            self.messages_table.setItem(row_index, 0, item_name)
-            self.messages_table.setItem(row_index, 1, QTableWidgetItem(hex(msg['id'])))
-            for col_index, byte_value in enumerate(msg['data']):
-                self.messages_table.setItem(row_index, col_index + 2, QTableWidgetItem(hex(byte_value)))
-
-        self.messages_table.blockSignals(False)
-
+    @pyqtSlot()
     def handle_add_message(self):
         """Handles adding a new message."""
         name = self.message_name_input.text().strip()
@@ -74,18 +205,17 @@ class MessageController:
             parsed_id = parse_value(message_id)
             if not (0 <= parsed_id <= 0x7FF):
                 raise ValueError(f"Invalid Message ID: {parsed_id}")
-            parsed_bytes = []
-            for i, byte in enumerate(message_bytes):
-                if byte:
-                    parsed_byte = parse_value(byte)
-                    if not (0 <= parsed_byte <= 255):
-                        raise ValueError(f"Invalid Byte {i}: {parsed_byte}")
-                    parsed_bytes.append(parsed_byte)
-                else:
-                    parsed_bytes.append(0)
-            data = " ".join(hex(b) for b in parsed_bytes)
-            if self.message_manager.add_message(name, hex(parsed_id), data):
-                self.update_messages_table()
+            if " " in message_bytes[0] and not any(message_bytes[1:]):
+                # Several bytes pasted into the first field, e.g. "0x01 2 0b11"; each token
+                # means the same as it would typed into its own field
+                parsed_bytes = parse_bytes(message_bytes[0].split())
+                if len(parsed_bytes) > len(message_bytes):
+                    raise ValueError(f"Message data exceeds {len(message_bytes)} bytes.")
+                parsed_bytes = parsed_bytes.ljust(len(message_bytes), b"\0")
+            else:
+                # Empty fields become 0; common spellings resolve from the lookup table in one batch
+                parsed_bytes = parse_bytes([byte or "0" for byte in message_bytes])
+            if self.messages_model.add_message(name, parsed_id, parsed_bytes):
                 self.message_name_input.clear()
                 self.message_id_input.clear()
                 for input_field in self.message_byte_inputs:
@@ -95,60 +225,22 @@ class MessageController:
         except ValueError as e:
             self.main_window.show_error(str(e))
 
+    @pyqtSlot()
     def handle_remove_message(self):
         """Handles removing selected messages."""
-        selected_rows = sorted({index.row() for index in self.messages_table.selectedIndexes()}, reverse=True)
+        selected_rows = sorted(rows_in_selection(self.messages_table), reverse=True)
         if not selected_rows:
             self.main_window.show_error("Please select one or more messages to remove.")
             return
 
-        for row in selected_rows:
-            name = self.messages_table.item(row, 0).text()
-            if not self.message_manager.remove_message(name):
-                self.main_window.show_error(f"Failed to remove message: {name}")
-
-        self.update_messages_table()
+        self.messages_model.remove_rows(selected_rows)
 
+    @pyqtSlot()
     def handle_clear_messages(self):
         """Clears all messages."""
-        self.message_manager.clear_messages()
-        self.update_messages_table()
-
-    def handle_edit_message(self, item):
-        """Handles editing a message directly in the table."""
-        row = item.row()
-        name_item = self.messages_table.item(row, 0)
-        if not name_item:
-            return
-        old_msg = name_item.data(Qt.ItemDataRole.UserRole)
-        if not old_msg:
-            return
-
-        # Read new values from the row:
-        new_name = self.messages_table.item(row, 0).text().strip()
-        new_message_id_text = self.messages_table.item(row, 1).text().strip()
-        new_data_list = []
-        for col in range(2, 10):
-            cell_item = self.messages_table.item(row, col)
-            cell_text = cell_item.text().strip() if cell_item and cell_item.text().strip() else "0"
-            new_data_list.append(cell_text)
-        new_data_str = " ".join(new_data_list)
-
-        # Use the MessageManager’s update function (which updates if the message exists, or adds it if not)
-        self.message_manager.update_message(new_name, new_message_id_text, new_data_str)
-
-        # Update the stored message in the UserRole data (a simple conversion is used here)
-        try:
-            new_message = {
-                "name": new_name,
-                "id": int(new_message_id_text, 0),
-                "data": [int(x, 0) for x in new_data_list]
-            }
-            name_item.setData(Qt.ItemDataRole.UserRole, new_message)
-            logging.info("Message updated via in-table edit.")
-        except Exception as e:
-            self.main_window.show_error(f"Error updating message: {e}")
+        self.messages_model.clear()
 
+    @pyqtSlot()
     def handle_send_message(self):
         """Handles sending a message defined in the text fields."""
         name = self.message_name_input.text().strip()
@@ -160,9 +252,7 @@ class MessageController:
             return
 
         try:
-            # Use int(x, 0) so that hex (0x..), binary (0b..), or decimal are supported
-            parsed_id = int(message_id_text, 0)
-            parsed_data = [int(b, 0) if b else 0 for b in message_bytes]
+            parsed_id, parsed_data = _parse_send_inputs(message_id_text, tuple(message_bytes))
 
             can_interface = self.main_window.can_controller.can_interface
             if not can_interface.is_connected():
@@ -170,13 +260,17 @@ class MessageController:
                 return
 
             can_interface.send_message(parsed_id, parsed_data)
-            logging.info(f"Sent message: ID={hex(parsed_id)}, Data={[hex(d) for d in parsed_data]}")
+            # send_message only succeeds for bytes in 0..255, so the byte table applies;
+            # the hex list is only built when debug logging is on
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sent message: ID=%#x, Data=%s", parsed_id, [HEX_BYTE[d] for d in parsed_data])
         except Exception as e:
             self.main_window.show_error(f"Error sending message: {e}")
 
+    @pyqtSlot()
     def handle_send_selected_message(self):
         """Handles sending one or more selected messages from the messages table."""
-        selected_rows = sorted({index.row() for index in self.messages_table.selectedIndexes()})
+        selected_rows = sorted(rows_in_selection(self.messages_table))
         if not selected_rows:
             self.main_window.show_error("Please select one or more messages to send.")
             return
@@ -186,14 +280,14 @@ class MessageController:
             self.main_window.show_error("CAN interface is not connected.")
             return
 
+        # Read the manager's columns directly; no per-message dicts are built for a bulk send
+        manager = self.message_manager
+        names, ids, data = manager.names, manager.ids, manager.data
+        send = can_interface.send_message
         for row in selected_rows:
-            name_item = self.messages_table.item(row, 0)
-            if name_item:
-                message = name_item.data(Qt.ItemDataRole.UserRole)
-                if message:
-                    try:
-                        can_interface.send_message(message['id'], message['data'])
-                        logging.info(f"Sent message: {message['name']} (ID={hex(message['id'])})")
-                    except Exception as e:
-                        self.main_window.show_error(f"Error sending message '{message['name']}': {e}")
+            try:
+                send(ids[row], data[row])
+                logger.debug("Sent message: %s (ID=%#x)", names[row], ids[row])
+            except Exception as e:
+                self.main_window.show_error(f"Error sending message '{names[row]}': {e}")
 
@@ -1,68 +1,253 @@
 import logging
-from PyQt6.QtGui import QStandardItem, QStandardItemModel
+import time
+from array import array
 from PyQt6.QtWidgets import QTableView
-from queue import Empty
+from PyQt6.QtCore import Qt, QObject, QEvent, QTimer, QAbstractTableModel, QModelIndex
+from controllers.widgets import bind_widgets
+from core.remote_protocol import ROW_TYPES, TYPE_CODES, unpack_rows
+from core.utils import HEX_BYTE, format_id, format_timestamp
+
+MONITOR_HEADERS = ("Timestamp", "Type", "Message ID") + tuple(f"Byte {i}" for i in range(8))
+
+
+class _ShowWatcher(QObject):
+    """Event filter that calls back when the watched widget is shown."""
+
+    def __init__(self, callback, parent=None):
+        super().__init__(parent)
+        self._callback = callback
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Show:
+            self._callback()
+        return False
+
+
+class CanMessageModel(QAbstractTableModel):
+    """
+    Read-only table model for monitored CAN frames, backed by a fixed-size ring buffer.
+    Rows are appended as (timestamp, type, id, data) tuples and stored column-wise in
+    preallocated arrays: time.time_ns() timestamp, type code, arbitration ID, data length
+    and eight data bytes, about 22 bytes per frame. Cells are only formatted in data()
+    for the rows the view actually paints. Rows that don't fit the schema (e.g.
+    preformatted messages from a remote server) are kept as tuples on the side.
+    Once the buffer is full, the oldest rows are dropped.
+    """
+
+    def __init__(self, capacity=50_000, parent=None):
+        super().__init__(parent)
+        self._capacity = capacity
+        self._timestamps = array('q', bytes(8 * capacity))
+        self._types = bytearray(capacity)
+        self._ids = array('L', bytes(array('L').itemsize * capacity))
+        self._lengths = bytearray(capacity)
+        self._data = bytearray(8 * capacity)
+        # Slot -> row tuple for rows stored as-is
+        self._other_rows = {}
+        self._start = 0
+        self._count = 0
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._count
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(MONITOR_HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        slot = (self._start + index.row()) % self._capacity
+        column = index.column()
+        if self._other_rows and slot in self._other_rows:
+            return self._other_data(self._other_rows[slot], column)
+        if column == 0:
+            return format_timestamp(self._timestamps[slot])
+        if column == 1:
+            return ROW_TYPES[self._types[slot]]
+        if column == 2:
+            return format_id(self._ids[slot])
+        byte_index = column - 3
+        if byte_index >= self._lengths[slot]:
+            return None
+        return HEX_BYTE[self._data[8 * slot + byte_index]]
+
+    @staticmethod
+    def _other_data(row, column):
+        timestamp, msg_type, msg_id, data = row
+        if column == 0:
+            return format_timestamp(timestamp) if isinstance(timestamp, int) else timestamp
+        if column == 1:
+            return msg_type
+        if column == 2:
+            return format_id(msg_id) if isinstance(msg_id, int) else msg_id
+        byte_index = column - 3
+        if byte_index >= len(data):
+            return None
+        value = data[byte_index]
+        return HEX_BYTE[value] if isinstance(value, int) else value
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return MONITOR_HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def append_rows(self, rows):
+        """
+        Appends rows with a single insert notification, first evicting the
+        oldest rows if the buffer would overflow.
+
+        Args:
+            rows (list[tuple]): (timestamp, type, id, data) tuples.
+        """
+        if not rows:
+            return
+        capacity = self._capacity
+        rows = rows[-capacity:]
+        overflow = self._count + len(rows) - capacity
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            self._start = (self._start + overflow) % capacity
+            self._count -= overflow
+            self.endRemoveRows()
+
+        first = self._count
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        timestamps, types, ids, lengths, data = self._timestamps, self._types, self._ids, self._lengths, self._data
+        other_rows = self._other_rows
+        type_codes = TYPE_CODES
+        for offset, row in enumerate(rows, self._start + first):
+            slot = offset % capacity
+            timestamp, msg_type, msg_id, payload = row
+            code = type_codes.get(msg_type)
+            if (code is None or type(timestamp) is not int or type(msg_id) is not int
+                    or not isinstance(payload, (bytes, bytearray)) or len(payload) > 8):
+                other_rows[slot] = row
+                continue
+            if other_rows:
+                other_rows.pop(slot, None)
+            timestamps[slot] = timestamp
+            types[slot] = code
+            ids[slot] = msg_id
+            lengths[slot] = len(payload)
+            data[8 * slot:8 * slot + len(payload)] = payload
+        self._count += len(rows)
+        self.endInsertRows()
+
 
 class MonitorController:
+    __slots__ = (
+        "main_window", "monitor_table", "monitor_model", "poll_timer",
+        "_show_watcher", "_scroll_on_show", "_stick_to_bottom",
+    )
+
+    # Upper bound on frames moved into the table per poll, to keep the GUI responsive under bursts
+    MAX_ROWS_PER_TICK = 2000
+    # Poll interval bounds; the interval drops to the minimum while frames keep arriving and backs off when idle
+    POLL_MIN_MS = 1
+    POLL_MAX_MS = 50
+    # Frames drained in one poll that count as busy
+    POLL_BUSY_THRESHOLD = 50
+
     def __init__(self, main_window):
         self.main_window = main_window
-        self.monitor_table: QTableView = self.main_window.findChild(QTableView, "tableMonitor")
+        self.monitor_table: QTableView = bind_widgets(self.main_window, {"tableMonitor": QTableView}, QObject)["tableMonitor"]
         if not self.monitor_table:
             raise ValueError("Monitor table not found in the UI.")
+        # Set when rows arrived while the table was hidden and it was following the newest row
+        self._scroll_on_show = False
+        self._show_watcher = _ShowWatcher(self.flush_deferred_scroll, self.monitor_table)
+        self.monitor_table.installEventFilter(self._show_watcher)
         self.setup_table()
+        self.poll_timer = QTimer(self.main_window)
+        self.poll_timer.timeout.connect(self.update_monitor_table)
+        self.poll_timer.start(20)
 
     def setup_table(self):
         """Set up the monitor table for displaying CAN messages."""
-        self.monitor_model = QStandardItemModel(0, 11, self.main_window)
-        self.monitor_model.setHorizontalHeaderLabels(
-            ["Timestamp", "Type", "Message ID"] + [f"Byte {i}" for i in range(8)]
-        )
+        self.monitor_model = CanMessageModel(parent=self.main_window)
         self.monitor_table.setModel(self.monitor_model)
+        # Follow the newest row while the view is scrolled to the bottom; tracked on scroll, not per insert
+        self._stick_to_bottom = True
+        self.monitor_table.verticalScrollBar().valueChanged.connect(self._on_scroll)
+
+    def _on_scroll(self, value):
+        """Records whether the user left the view at the bottom."""
+        self._stick_to_bottom = value == self.monitor_table.verticalScrollBar().maximum()
 
     def update_monitor_table(self):
-        """Polls for new messages from both RX and TX queues and updates the monitor table."""
+        """
+        Polls for new messages from both RX and TX queues and updates the monitor table.
+        Everything drained in one call is added to the model as a single batch.
+        Called by poll_timer, whose interval follows the traffic seen here.
+        """
         can_interface = self.main_window.can_controller.can_interface
+        filter_manager = self.main_window.filter_controller.filter_manager
+        if can_interface.filter_revision != filter_manager.revision and can_interface.is_connected():
+            # Let the kernel drop frames for IDs no filter asks for
+            can_interface.set_id_filters(filter_manager.filtered_ids(), filter_manager.revision)
+
+        # Raw clock reads; formatting is left to the model, for visible rows only
+        now_ns = time.time_ns
+        limit = self.MAX_ROWS_PER_TICK
+        rows = []
+
+        # Everything the loops touch is bound to a local first
+        add_row = rows.append
+        matches = filter_manager.matches
 
         # Process any transmitted (Tx) messages.
-        while True:
-            try:
-                tx_msg = can_interface.tx_queue.get_nowait()
-            except Empty:
-                break  # Queue is empty
-            message_dict = {
-                "timestamp": self.main_window.get_current_timestamp(),
-                "type": "Tx",
-                "id": hex(tx_msg.arbitration_id),
-                "data": [hex(byte) for byte in tx_msg.data]
-            }
-            self.append_message(message_dict)
-
-        # Process received (Rx) messages.
-        while True:
-            rx_msg = can_interface.get_received_message()
-            if not rx_msg:
-                break
-            message_dict = {
-                "timestamp": self.main_window.get_current_timestamp(),
-                "type": "Rx",
-                "id": hex(rx_msg.arbitration_id),
-                "data": [hex(byte) for byte in rx_msg.data]
-            }
-            self.append_message(message_dict)
+        for tx_msg in can_interface.get_sent_messages(limit):
+            add_row((now_ns(), "Tx", tx_msg.arbitration_id, tx_msg.data))
 
-    def append_message(self, message_dict):
-        """Helper method to append a message row to the monitor table."""
-        timestamp_item = QStandardItem(message_dict.get("timestamp", ""))
-        type_item = QStandardItem(message_dict.get("type", ""))
-        id_item = QStandardItem(message_dict.get("id", ""))
-        data_items = [QStandardItem(byte) for byte in message_dict.get("data", [])]
-        row = [timestamp_item, type_item, id_item] + data_items
-        self.monitor_model.appendRow(row)
-        # Check if the vertical scroll bar is at its maximum
-        vertical_scroll_bar = self.monitor_table.verticalScrollBar()
-        if vertical_scroll_bar.value() == vertical_scroll_bar.maximum():
+        # Process received (Rx) messages, dropping frames rejected by the active filters.
+        rx_msgs = can_interface.get_received_messages(limit - len(rows))
+        drained = len(rows) + len(rx_msgs)
+        for rx_msg in rx_msgs:
+            arbitration_id = rx_msg.arbitration_id
+            data = rx_msg.data
+            if matches(arbitration_id, data, rx_msg.is_extended_id):
+                add_row((now_ns(), "Rx", arbitration_id, bytes(data)))
+
+        # Frames beyond the limit stay queued for the next tick
+        self.append_rows(rows)
+
+        # Poll again right away while busy; double the interval while traffic is light
+        poll_timer = self.poll_timer
+        current = poll_timer.interval()
+        if drained >= self.POLL_BUSY_THRESHOLD:
+            interval = self.POLL_MIN_MS
+        else:
+            interval = min(current * 2, self.POLL_MAX_MS)
+        if interval != current:
+            poll_timer.setInterval(interval)
+
+    def flush_deferred_scroll(self):
+        """Scrolls to the newest row if rows were appended while the table was hidden."""
+        if self._scroll_on_show:
+            self._scroll_on_show = False
             self.monitor_table.scrollToBottom()
-        # If running in server mode, you may also choose to broadcast the message.
+
+    def append_message(self, message_dict):
+        """Helper method to append an already formatted message (e.g. from a remote server)."""
+        self.append_rows(unpack_rows(message_dict))
+
+    def append_rows(self, rows):
+        """Adds rows to the model in one batch, follows the newest row and forwards them to remote clients."""
+        if not rows:
+            return
+        self.monitor_model.append_rows(rows)
+        if self._stick_to_bottom:
+            if self.monitor_table.isVisible():
+                self.monitor_table.scrollToBottom()
+            else:
+                # Scrolling a hidden view is wasted work; do it once when the tab is shown
+                self._scroll_on_show = True
+        # In server mode, forward the whole batch to remote clients in a single frame
         remote_ctrl = getattr(self.main_window, "remote_controller", None)
         if remote_ctrl and remote_ctrl.mode == "server" and remote_ctrl.server:
-            remote_ctrl.server.broadcast_message(message_dict)
+            remote_ctrl.server.broadcast_rows(rows)
@@ -1,171 +1,45 @@
-import socket
-import threading
-import json
 import logging
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
 from PyQt6.QtWidgets import QRadioButton, QPushButton, QLineEdit
+from controllers.widgets import bind_widgets
+from core.remote import RemoteConnection, RemoteServer
+from core.remote_protocol import unpack_rows
 
-########################################################################
-# Remote Server
-########################################################################
-
-class RemoteServer:
-    def __init__(self, port, can_interface):
-        """
-        :param port: TCP port to listen on.
-        :param can_interface: The local CAN interface object to use for sending messages.
-        """
-        self.port = port
-        self.can_interface = can_interface
-        self.clients = []
-        self.server_socket = None
-        self.running = False
-        self.server_thread = None
-
-    def start(self):
-        if self.running:
-            return
-        self.running = True
-        self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        # Allow address reuse
-        self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        self.server_socket.bind(('', self.port))
-        self.server_socket.listen(5)
-        self.server_thread = threading.Thread(target=self.accept_clients, daemon=True)
-        self.server_thread.start()
-        logging.info(f"Remote server started on port {self.port}.")
-
-    def accept_clients(self):
-        while self.running:
-            try:
-                client_socket, addr = self.server_socket.accept()
-                logging.info(f"Client connected from {addr}.")
-                self.clients.append(client_socket)
-                # Start a thread to handle incoming commands from this client
-                threading.Thread(target=self.handle_client, args=(client_socket,), daemon=True).start()
-            except Exception as e:
-                logging.error(f"Error accepting client: {e}")
-
-    def handle_client(self, client_socket):
-        while self.running:
-            try:
-                data = client_socket.recv(1024)
-                if not data:
-                    break
-                try:
-                    msg = json.loads(data.decode())
-                    self.handle_command(msg, client_socket)
-                except json.JSONDecodeError:
-                    logging.error("Received invalid JSON from client.")
-            except Exception as e:
-                logging.error(f"Error handling client: {e}")
-                break
-        # Remove the client on disconnect
-        if client_socket in self.clients:
-            self.clients.remove(client_socket)
-        client_socket.close()
-        logging.info("Client disconnected.")
-
-    def handle_command(self, command, client_socket):
-        """
-        Process a command sent by a remote client.
-        For now, we support a 'send_message' command.
-        Expected command format (JSON):
-          { "cmd": "send_message", "data": { "id": "0x123", "data": "0x01 0x02 ..." } }
-        """
-        if command.get("cmd") == "send_message":
-            msg_data = command.get("data")
-            if msg_data:
-                try:
-                    message_id = int(msg_data.get("id"), 0)
-                    # Assume the data is a space‐separated string of numbers (in hex, binary, or decimal)
-                    data_str = msg_data.get("data")
-                    data_bytes = [int(b, 0) for b in data_str.split()]
-                    self.can_interface.send_message(message_id, data_bytes)
-                    logging.info(f"Remote server sent message: ID {hex(message_id)}, Data {data_bytes}")
-                except Exception as e:
-                    logging.error(f"Error processing send_message command: {e}")
-        else:
-            logging.warning("Received unknown command from client.")
-
-    def broadcast_message(self, message):
-        """
-        Broadcast a CAN message (as a dictionary) to all connected clients.
-        Expected message format (for example):
-           { "timestamp": "2023-05-01 12:34:56.789",
-             "type": "Rx",
-             "id": "0x123",
-             "data": ["0x01", "0x02", ...] }
-        """
-        msg_json = json.dumps(message).encode()
-        for client in self.clients:
-            try:
-                client.sendall(msg_json)
-            except Exception as e:
-                logging.error(f"Error broadcasting message: {e}")
-
-    def stop(self):
-        self.running = False
-        if self.server_socket:
-            self.server_socket.close()
-        for client in self.clients:
-            try:
-                client.close()
-            except Exception:
-                pass
-        self.clients = []
-        logging.info("Remote server stopped.")
+logger = logging.getLogger(__name__)
 
 ########################################################################
-# Remote Client (QThread-based)
+# Remote Client
 ########################################################################
 
-class RemoteClient(QThread):
-    message_received = pyqtSignal(dict)
+class RemoteClient(QObject):
+    """
+    Connects to a RemoteServer and emits message_received for every streamed message.
+    Messages are read on the shared network reactor thread; the signal is queued to
+    the receiver's thread, so slots still run on the GUI thread.
+    """
+    # Declared as object: a queued dict would be marshalled as a QVariantMap, mangling bytes and tuples
+    message_received = pyqtSignal(object)
 
     def __init__(self, host, port):
         super().__init__()
-        self.host = host
-        self.port = port
-        self.socket = None
-        self.running = False
+        self._connection = RemoteConnection(host, port, self.message_received.emit)
 
-    def run(self):
-        self.running = True
-        try:
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.connect((self.host, self.port))
-            logging.info(f"Connected to remote server at {self.host}:{self.port}")
-            while self.running:
-                data = self.socket.recv(1024)
-                if not data:
-                    break
-                try:
-                    msg = json.loads(data.decode())
-                    self.message_received.emit(msg)
-                except json.JSONDecodeError:
-                    logging.error("Received invalid JSON from server.")
-        except Exception as e:
-            logging.error(f"Remote client error: {e}")
-        if self.socket:
-            self.socket.close()
-        logging.info("Remote client disconnected.")
+    def start(self):
+        """Connects in the background, then hands the socket to the reactor."""
+        self._connection.start()
 
     def send_command(self, command):
         """
         Send a command (as a dictionary) to the remote server.
         """
-        if self.socket:
-            try:
-                msg_json = json.dumps(command).encode()
-                self.socket.sendall(msg_json)
-            except Exception as e:
-                logging.error(f"Error sending command to server: {e}")
+        self._connection.send_command(command)
 
     def disconnect(self):
-        self.running = False
-        if self.socket:
-            self.socket.close()
+        self._connection.disconnect()
+
+    def wait(self):
+        """Waits for a connection attempt in progress to finish."""
+        self._connection.wait()
 
 ########################################################################
 # Remote Controller (UI Integration)
@@ -189,16 +63,26 @@ class RemoteController:
         self.init_widgets()
 
     def init_widgets(self):
-        # Obtain remote tab widgets using findChild.
+        # Obtain remote tab widgets in a single lookup.
         # (Make sure these names match your UI file.)
-        self.radioButtonServer = self.main_window.findChild(QRadioButton, "radioButtonServer")
-        self.radioButtonClient = self.main_window.findChild(QRadioButton, "radioButtonClient")
-        self.radioButtonLocal  = self.main_window.findChild(QRadioButton, "radioButtonLocal")
-        self.buttonClientConnect = self.main_window.findChild(QPushButton, "buttonClientConnect")
-        self.inputClientIp = self.main_window.findChild(QLineEdit, "inputClientIp")
-        self.inputClientPort = self.main_window.findChild(QLineEdit, "inputClientPort")
-        self.buttonServerStart = self.main_window.findChild(QPushButton, "buttonServerStart")
-        self.inputServerPort = self.main_window.findChild(QLineEdit, "inputServerPort")
+        widgets = bind_widgets(self.main_window, {
+            "radioButtonServer": QRadioButton,
+            "radioButtonClient": QRadioButton,
+            "radioButtonLocal": QRadioButton,
+            "buttonClientConnect": QPushButton,
+            "inputClientIp": QLineEdit,
+            "inputClientPort": QLineEdit,
+            "buttonServerStart": QPushButton,
+            "inputServerPort": QLineEdit,
+        }, QObject)
+        self.radioButtonServer = widgets["radioButtonServer"]
+        self.radioButtonClient = widgets["radioButtonClient"]
+        self.radioButtonLocal = widgets["radioButtonLocal"]
+        self.buttonClientConnect = widgets["buttonClientConnect"]
+        self.inputClientIp = widgets["inputClientIp"]
+        self.inputClientPort = widgets["inputClientPort"]
+        self.buttonServerStart = widgets["buttonServerStart"]
+        self.inputServerPort = widgets["inputServerPort"]
 
         # Connect radio buttons to mode change.
         if self.radioButtonLocal:
@@ -215,7 +99,7 @@ class RemoteController:
 
     def set_mode(self, mode):
         self.mode = mode
-        logging.info(f"Remote mode set to: {mode}")
+        logger.info("Remote mode set to: %s", mode)
         if mode == "local":
             self.stop_server()
             self.stop_client()
@@ -224,36 +108,38 @@ class RemoteController:
         elif mode == "client":
             self.stop_server()
 
+    @pyqtSlot()
     def handle_server_start(self):
         try:
             port = int(self.inputServerPort.text().strip())
         except ValueError:
-            logging.error("Invalid server port.")
+            logger.error("Invalid server port.")
             return
         if self.server:
             self.stop_server()
         self.server = RemoteServer(port, self.can_interface)
         self.server.start()
-        logging.info("Remote server started.")
+        logger.info("Remote server started.")
 
     def stop_server(self):
         if self.server:
             self.server.stop()
             self.server = None
 
+    @pyqtSlot()
     def handle_client_connect(self):
         ip = self.inputClientIp.text().strip()
         try:
             port = int(self.inputClientPort.text().strip())
         except ValueError:
-            logging.error("Invalid client port.")
+            logger.error("Invalid client port.")
             return
         if self.client:
             self.stop_client()
         self.client = RemoteClient(ip, port)
         self.client.message_received.connect(self.handle_remote_message)
         self.client.start()
-        logging.info("Remote client connecting...")
+        logger.info("Remote client connecting...")
 
     def stop_client(self):
         if self.client:
@@ -261,14 +147,15 @@ class RemoteController:
             self.client.wait()
             self.client = None
 
+    @pyqtSlot(object)
     def handle_remote_message(self, message):
         """
         Called when a remote CAN message is received.
         The 'message' is expected to be a dict with keys such as
-        'timestamp', 'type', 'id', and 'data'.
+        'timestamp', 'type', 'id', and 'data', or a batch of monitor rows.
         Forward it to the monitor controller for display.
         """
-        self.monitor_controller.append_message(message)
+        self.monitor_controller.append_rows(unpack_rows(message))
 
 
     def send_remote_command(self, command):
@@ -280,4 +167,4 @@ class RemoteController:
             self.client.send_command(command)
         elif self.mode == "server":
             # In server mode, you might choose to handle local commands directly.
-            logging.info("Server mode: command processing is done locally.")
+            logger.info("Server mode: command processing is done locally.")
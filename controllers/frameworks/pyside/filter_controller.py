@@ -1,35 +1,51 @@
 import logging
 from PySide6.QtWidgets import QLineEdit, QPushButton, QTableWidget, QTableWidgetItem, QMessageBox
-from core.filter_manager import FilterManager
+from PySide6.QtCore import Qt, QObject, Slot
+from controllers.widgets import bind_widgets
+from controllers.filter_controller_core import FilterControllerCore
+from core.utils import HEX_BYTE, HEX_ID
 
-class PySideFilterController:
+logger = logging.getLogger(__name__)
+
+class PySideFilterController(FilterControllerCore):
     def __init__(self, main_window):
+        super().__init__()
         self.main_window = main_window
-        self.filter_manager = FilterManager()
+        # Filter shown on each row, keyed by the int handle stored in the row's UserRole
+        self._filters_by_handle = {}
+        self._next_handle = 0
         self.init_widgets()
 
     def init_widgets(self):
         """Initialize filter-related widgets and connect signals."""
         # In the PyDracula UI, we need to adapt to use appropriate widget names
         # For demo purposes, we use placeholders that will need to be updated
-        self.filter_id_input = self.main_window.findChild(QLineEdit, "lineEdit_filterId")  # Replace with actual name
-        self.filter_mask_input = self.main_window.findChild(QLineEdit, "lineEdit_filterMask")  # Replace with actual name
-        self.add_filter_button = self.main_window.findChild(QPushButton, "pushButton_addFilter")  # Replace with actual name
-        self.remove_filter_button = self.main_window.findChild(QPushButton, "pushButton_removeFilter")  # Replace with actual name
-        self.filter_table = self.main_window.findChild(QTableWidget, "tableWidget_filters")  # Replace with actual name
+        widgets = bind_widgets(self.main_window, {
+            "lineEdit_filterId": QLineEdit,
+            "lineEdit_filterMask": QLineEdit,
+            "pushButton_addFilter": QPushButton,
+            "pushButton_removeFilter": QPushButton,
+            "tableWidget_filters": QTableWidget,
+        }, QObject)
+        self.filter_id_input = widgets["lineEdit_filterId"]
+        self.filter_mask_input = widgets["lineEdit_filterMask"]
+        self.add_filter_button = widgets["pushButton_addFilter"]
+        self.remove_filter_button = widgets["pushButton_removeFilter"]
+        self.filter_table = widgets["tableWidget_filters"]
 
-        # Connect signals if widgets exist
-        if self.add_filter_button:
+        # Connect each handler only if every widget it uses exists, so handlers need no per-click checks
+        if all((self.filter_id_input, self.filter_mask_input, self.add_filter_button, self.filter_table)):
             self.add_filter_button.clicked.connect(self.handle_add_filter)
-        if self.remove_filter_button:
+        else:
+            logger.warning("Filter input widgets not found in UI; adding filters is disabled.")
+        if all((self.remove_filter_button, self.filter_table)):
             self.remove_filter_button.clicked.connect(self.handle_remove_filter)
+        else:
+            logger.warning("Filter table not found in UI; removing filters is disabled.")
 
+    @Slot()
     def handle_add_filter(self):
         """Handles adding a new filter."""
-        if not self.filter_id_input or not self.filter_mask_input:
-            self.main_window.show_error("Filter input fields not found in UI.")
-            return
-            
         filter_id = self.filter_id_input.text().strip()
         filter_mask = self.filter_mask_input.text().strip()
         
@@ -38,57 +54,64 @@ class PySideFilterController:
             return
         
         # Add the filter
-        if self.filter_manager.add_filter(filter_id, filter_mask):
-            logging.info(f"Added filter with ID {filter_id} and mask {filter_mask}.")
-            self.update_filter_table()
+        added = self.filter_manager.add_filter(filter_id, filter_mask)
+        if added:
+            logger.info("Added filter with ID %s and mask %s.", filter_id, filter_mask)
+            # Only the new filter's row is added; the rest of the table is unchanged
+            row = self.filter_table.rowCount()
+            self.filter_table.insertRow(row)
+            self._set_row(row, added)
             # Clear input fields
             self.filter_id_input.clear()
             self.filter_mask_input.clear()
         else:
             self.main_window.show_error("Failed to add filter (invalid format or duplicate).")
 
+    @Slot()
     def handle_remove_filter(self):
         """Handles removing a selected filter."""
-        if not self.filter_table:
-            self.main_window.show_error("Filter table not found in UI.")
-            return
-            
         selected_rows = self.filter_table.selectedIndexes()
         if not selected_rows:
             self.main_window.show_error("Please select a filter to remove.")
             return
         
         row = selected_rows[0].row()
-        filter_id = self.filter_table.item(row, 0).text()
-        filter_mask = self.filter_table.item(row, 1).text()
-        
-        # Convert string mask to list
-        mask_parts = filter_mask.split()
-        
-        if self.filter_manager.remove_filter(filter_id, mask_parts):
-            logging.info(f"Removed filter with ID {filter_id} and mask {filter_mask}.")
-            self.update_filter_table()
+        # The row carries a handle to the parsed filter set by _set_row, so no display text is parsed back
+        handle = self.filter_table.item(row, 0).data(Qt.UserRole)
+        filter_data = self._filters_by_handle.get(handle)
+        if filter_data and self.filter_manager.remove_filter_parsed(filter_data["id"], filter_data["mask"]):
+            logger.info("Removed filter with ID %#x and mask %s.", filter_data["id"], filter_data["mask"].hex(" "))
+            del self._filters_by_handle[handle]
+            self.filter_table.removeRow(row)
         else:
             self.main_window.show_error("Failed to remove filter.")
 
     def update_filter_table(self):
         """Updates the filter table with current filters."""
-        if not self.filter_table:
-            logging.error("Filter table not found in UI.")
-            return
-            
-        # Clear the table
-        self.filter_table.setRowCount(0)
-        
-        # Add each filter
-        for i, filter_data in enumerate(self.filter_manager.get_filters()):
-            self.filter_table.insertRow(i)
-            
-            # Set filter ID
-            id_item = QTableWidgetItem(filter_data["id"])
-            self.filter_table.setItem(i, 0, id_item)
-            
-            # Set filter mask
-            mask_str = " ".join(filter_data["mask"])
-            mask_item = QTableWidgetItem(mask_str)
-            self.filter_table.setItem(i, 1, mask_item)
\ No newline at end of file
+        filters = self.filter_manager.get_filters()
+        table = self.filter_table
+        # Fill the table with updates and sorting off, sized once instead of inserting row by row
+        sorting_enabled = table.isSortingEnabled()
+        table.setSortingEnabled(False)
+        table.setUpdatesEnabled(False)
+        try:
+            table.setRowCount(0)
+            table.setRowCount(len(filters))
+            self._filters_by_handle = {}
+            for i, filter_data in enumerate(filters):
+                self._set_row(i, filter_data)
+        finally:
+            table.setUpdatesEnabled(True)
+            table.setSortingEnabled(sorting_enabled)
+
+    def _set_row(self, row, filter_data):
+        """Writes one filter into the given table row."""
+        # Filters in the manager are range-checked on add, so the hex tables always apply
+        handle = self._next_handle
+        self._next_handle += 1
+        self._filters_by_handle[handle] = filter_data
+        id_item = QTableWidgetItem(HEX_ID[filter_data["id"]])
+        # Store an int handle into _filters_by_handle rather than marshalling the filter
+        id_item.setData(Qt.UserRole, handle)
+        self.filter_table.setItem(row, 0, id_item)
+        self.filter_table.setItem(row, 1, QTableWidgetItem(" ".join([HEX_BYTE[b] for b in filter_data["mask"]])))
\ No newline at end of file
@@ -1,5 +1,7 @@
 import logging
 from PySide6.QtWidgets import QLineEdit, QPushButton
+from PySide6.QtCore import QObject, Slot
+from controllers.widgets import bind_widgets
 from core.message_manager import MessageManager
 
 class PySideMessageController:
@@ -12,21 +14,24 @@ class PySideMessageController:
         """Initialize message-related widgets and connect signals."""
         # In the PyDracula UI, we need to adapt to use appropriate widget names
         # For demo purposes, we use placeholders that will need to be updated
-        self.message_id_input = self.main_window.findChild(QLineEdit, "lineEdit_messageId")  # Replace with actual name
-        self.message_data_input = self.main_window.findChild(QLineEdit, "lineEdit_messageData")  # Replace with actual name
-        self.send_message_button = self.main_window.findChild(QPushButton, "pushButton_sendMessage")  # Replace with actual name
+        widgets = bind_widgets(self.main_window, {
+            "lineEdit_messageId": QLineEdit,
+            "lineEdit_messageData": QLineEdit,
+            "pushButton_sendMessage": QPushButton,
+        }, QObject)
+        self.message_id_input = widgets["lineEdit_messageId"]
+        self.message_data_input = widgets["lineEdit_messageData"]
+        self.send_message_button = widgets["pushButton_sendMessage"]
 
-        # Connect signals if widgets exist
-        if self.send_message_button:
+        # Connect the handler only if every widget it uses exists, so it needs no per-click checks
+        if all((self.message_id_input, self.message_data_input, self.send_message_button)):
             self.send_message_button.clicked.connect(self.handle_send_message)
+        else:
+            logging.warning("Message input widgets not found in UI; sending is disabled.")
 
+    @Slot()
     def handle_send_message(self):
         """Handles sending a CAN message."""
-        # Check if widgets exist
-        if not self.message_id_input or not self.message_data_input:
-            self.main_window.show_error("Message input fields not found in UI.")
-            return
-            
         # Get input values
         message_id = self.message_id_input.text().strip()
         message_data = self.message_data_input.text().strip()
@@ -47,7 +52,7 @@ class PySideMessageController:
         if self.message_manager.add_message("user", message_id, message_data, timestamp):
             # Send message via CAN interface
             can_interface.send_message(message_id, message_data)
-            logging.info(f"Sent message: ID={message_id}, Data={message_data}")
+            logging.debug("Sent message: ID=%s, Data=%s", message_id, message_data)
             
             # Clear input fields
             self.message_id_input.clear()
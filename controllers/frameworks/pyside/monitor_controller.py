@@ -1,29 +1,156 @@
 import logging
-from PySide6.QtWidgets import QTableWidget, QTableWidgetItem, QHeaderView
-from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QTableWidget, QTableView, QHeaderView
+from PySide6.QtCore import QObject, Qt, QAbstractTableModel, QModelIndex, Signal
+from PySide6.QtGui import QBrush, QColor
+from controllers.widgets import bind_widgets
 from core.message_manager import MessageManager
 from datetime import datetime
 
+# Background for rows that arrived since the last refresh (light green)
+NEW_BG = QColor(200, 255, 200)
+# Shared brush served for every highlighted cell, so data() never builds one per call
+NEW_BRUSH = QBrush(NEW_BG)
+
+MONITOR_HEADERS = ("Timestamp", "Source", "ID", "Data", "Count")
+
+
+class CanMessageModel(QAbstractTableModel):
+    """
+    Read-only table model for received CAN messages.
+    Rows are kept as plain tuples and served on demand, so the view only
+    queries the cells that are actually visible.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # (timestamp, source, id, data, count) per message
+        self._rows = []
+        # Whether each row arrived since the last refresh
+        self._new = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(MONITOR_HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == Qt.BackgroundRole and self._new[index.row()]:
+            return NEW_BRUSH
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return MONITOR_HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def set_rows(self, messages):
+        """
+        Replaces the model contents with the given messages.
+        When the existing rows are an unchanged prefix of the new ones, only the
+        appended rows are inserted; otherwise the model is reset.
+
+        Args:
+            messages (list[dict]): Messages as returned by MessageManager.get_messages().
+        """
+        rows = [
+            (msg["timestamp"], msg["source"], msg["id"], " ".join(msg["data"]), str(msg["count"]))
+            for msg in messages
+        ]
+        new = [bool(msg["new"]) for msg in messages]
+        old_count = len(self._rows)
+
+        if len(rows) < old_count or rows[:old_count] != self._rows:
+            self.beginResetModel()
+            self._rows, self._new = rows, new
+            self.endResetModel()
+            return
+
+        highlight_changed = new[:old_count] != self._new
+        if len(rows) > old_count:
+            self.beginInsertRows(QModelIndex(), old_count, len(rows) - 1)
+            self._rows, self._new = rows, new
+            self.endInsertRows()
+        else:
+            self._new = new
+        if highlight_changed and old_count:
+            # Only the highlight of already shown rows changed
+            self.dataChanged.emit(
+                self.index(0, 0), self.index(old_count - 1, len(MONITOR_HEADERS) - 1), [Qt.BackgroundRole]
+            )
+
+    def clear(self):
+        """Removes all rows."""
+        self.beginResetModel()
+        self._rows, self._new = [], []
+        self.endResetModel()
+
+
+class MonitorTableView(QTableView):
+    """QTableView that reports when it becomes visible, so deferred refreshes can be flushed."""
+
+    shown = Signal()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.shown.emit()
+
+
 class PySideMonitorController:
+    """
+    Monitor page of the PySide UI. Unlike the PyQt monitor it is not fed from the CAN
+    interface, so FilterManager's rules are not applied here; there are no received
+    frames to filter until this monitor gets a frame source.
+    """
+
     def __init__(self, main_window):
         self.main_window = main_window
         self.message_manager = MessageManager()
+        self.model = CanMessageModel()
         self.init_widgets()
-        self.last_message_count = 0
+        self.last_revision = -1
+        # Set when a refresh was skipped because the table was hidden
+        self._dirty = False
 
     def init_widgets(self):
         """Initialize monitor-related widgets."""
         # In the PyDracula UI, we need to adapt to use appropriate widget names
-        # For demo purposes, we use a placeholder that will need to be updated
-        self.monitor_table = self.main_window.findChild(QTableWidget, "tableWidget")  # Use the default table from PyDracula
+        # The generated UI ships a QTableWidget, which cannot take a custom model,
+        # so it is swapped in place for a QTableView backed by CanMessageModel
+        self.monitor_table = None
+        table_widget = bind_widgets(self.main_window, {"tableWidget": QTableWidget}, QObject)["tableWidget"]  # Use the default table from PyDracula
+        if not table_widget:
+            return
 
-        # Configure table if it exists
-        if self.monitor_table:
-            self.monitor_table.setColumnCount(5)
-            self.monitor_table.setHorizontalHeaderLabels(["Timestamp", "Source", "ID", "Data", "Count"])
-            self.monitor_table.horizontalHeader().setSectionResizeMode(3, QHeaderView.Stretch)  # Make data column expandable
-            self.monitor_table.setSelectionBehavior(QTableWidget.SelectRows)
-            self.monitor_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.monitor_table = MonitorTableView(table_widget.parentWidget())
+        self.monitor_table.setObjectName("tableMonitorView")
+        self.monitor_table.setStyleSheet(table_widget.styleSheet())
+        self.monitor_table.setSizePolicy(table_widget.sizePolicy())
+        layout = table_widget.parentWidget().layout()
+        if layout:
+            layout.replaceWidget(table_widget, self.monitor_table)
+        table_widget.hide()
+        table_widget.deleteLater()
+        # Keep later theme tweaks that go through the generated UI pointing at the live view
+        ui = getattr(self.main_window, "ui", None)
+        if ui is not None and getattr(ui, "tableWidget", None) is table_widget:
+            ui.tableWidget = self.monitor_table
+
+        # Configure the view
+        self.monitor_table.setModel(self.model)
+        self.monitor_table.horizontalHeader().setSectionResizeMode(3, QHeaderView.Stretch)  # Make data column expandable
+        self.monitor_table.setSelectionBehavior(QTableView.SelectRows)
+        self.monitor_table.setEditTriggers(QTableView.NoEditTriggers)
+        self.monitor_table.shown.connect(self.flush_deferred_update)
 
     def update_monitor_table(self):
         """
@@ -32,56 +159,33 @@ class PySideMonitorController:
         """
         if not self.monitor_table:
             return
+        if not self.monitor_table.isVisible():
+            # The page is not shown; refresh once it is (see flush_deferred_update)
+            self._dirty = True
+            return
+        self._dirty = False
 
         # Get messages from the message manager
         messages = self.message_manager.get_messages()
-        
-        # Clear previous content
-        # Optimization: only clear and repopulate if the number of messages has changed
-        if self.last_message_count != len(messages):
-            self.monitor_table.setRowCount(0)
-            
-            # Add each message
-            for i, msg in enumerate(messages):
-                self.monitor_table.insertRow(i)
-                
-                # Set timestamp
-                timestamp_item = QTableWidgetItem(msg["timestamp"])
-                self.monitor_table.setItem(i, 0, timestamp_item)
-                
-                # Set source
-                source_item = QTableWidgetItem(msg["source"])
-                self.monitor_table.setItem(i, 1, source_item)
-                
-                # Set ID
-                id_item = QTableWidgetItem(msg["id"])
-                self.monitor_table.setItem(i, 2, id_item)
-                
-                # Set data
-                data_item = QTableWidgetItem(" ".join(msg["data"]))
-                self.monitor_table.setItem(i, 3, data_item)
-                
-                # Set count
-                count_item = QTableWidgetItem(str(msg["count"]))
-                self.monitor_table.setItem(i, 4, count_item)
-                
-                # Highlight new messages
-                if msg["new"]:
-                    for col in range(5):
-                        item = self.monitor_table.item(i, col)
-                        item.setBackground(QColor(200, 255, 200))  # Light green
-            
-            self.last_message_count = len(messages)
-            
+
+        # Optimization: only refresh the model if the messages changed since the last refresh
+        if self.last_revision != self.message_manager.revision:
+            self.model.set_rows(messages)
+            self.last_revision = self.message_manager.revision
+
         # Update "new" flag in message manager
         self.message_manager.mark_all_as_old()
 
+    def flush_deferred_update(self):
+        """Applies a refresh that was skipped while the monitor table was hidden."""
+        if self._dirty:
+            self.update_monitor_table()
+
     def clear_monitor(self):
         """Clears the monitor table."""
-        if self.monitor_table:
-            self.monitor_table.setRowCount(0)
+        self.model.clear()
         self.message_manager.clear_messages()
-        self.last_message_count = 0
+        self.last_revision = -1
 
     def add_message(self, source, can_id, data):
         """
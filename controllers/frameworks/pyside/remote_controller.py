@@ -1,5 +1,7 @@
 import logging
 from PySide6.QtWidgets import QLineEdit, QPushButton, QLabel
+from PySide6.QtCore import QObject, Slot
+from controllers.widgets import bind_widgets
 from core.can_interface import CANInterface
 
 class PySideRemoteController:
@@ -15,30 +17,38 @@ class PySideRemoteController:
         """Initialize remote-related widgets and connect signals."""
         # In the PyDracula UI, we need to adapt to use appropriate widget names
         # For demo purposes, we use placeholders that will need to be updated
-        self.ip_input = self.main_window.findChild(QLineEdit, "lineEdit_ip")  # Replace with actual name
-        self.port_input = self.main_window.findChild(QLineEdit, "lineEdit_port")  # Replace with actual name
-        self.start_server_button = self.main_window.findChild(QPushButton, "pushButton_startServer")  # Replace with actual name
-        self.connect_client_button = self.main_window.findChild(QPushButton, "pushButton_connectClient")  # Replace with actual name
-        self.remote_status_label = self.main_window.findChild(QLabel, "label_remoteStatus")  # Replace with actual name
+        widgets = bind_widgets(self.main_window, {
+            "lineEdit_ip": QLineEdit,
+            "lineEdit_port": QLineEdit,
+            "pushButton_startServer": QPushButton,
+            "pushButton_connectClient": QPushButton,
+            "label_remoteStatus": QLabel,
+        }, QObject)
+        self.ip_input = widgets["lineEdit_ip"]
+        self.port_input = widgets["lineEdit_port"]
+        self.start_server_button = widgets["pushButton_startServer"]
+        self.connect_client_button = widgets["pushButton_connectClient"]
+        self.remote_status_label = widgets["label_remoteStatus"]
 
         # Set default port
         if self.port_input:
             self.port_input.setText("5000")
 
-        # Connect signals if widgets exist
-        if self.start_server_button:
+        # Connect each handler only if every widget it uses exists, so handlers need no per-click checks
+        if all((self.port_input, self.start_server_button)):
             self.start_server_button.clicked.connect(self.handle_start_server)
-        if self.connect_client_button:
+        else:
+            logging.warning("Remote server widgets not found in UI; starting a server is disabled.")
+        if all((self.ip_input, self.port_input, self.connect_client_button)):
             self.connect_client_button.clicked.connect(self.handle_connect_client)
+        else:
+            logging.warning("Remote client widgets not found in UI; connecting to a server is disabled.")
 
+    @Slot()
     def handle_start_server(self):
         """Handles starting/stopping a remote server."""
         # Implementation will depend on your remote server functionality
         # This placeholder would need to be completed based on your actual requirements
-        if not self.port_input:
-            self.main_window.show_error("Port input field not found in UI.")
-            return
-            
         port_str = self.port_input.text().strip()
         if not port_str:
             self.main_window.show_error("Port number is required.")
@@ -52,19 +62,15 @@ class PySideRemoteController:
             # Update UI
             if self.remote_status_label:
                 self.remote_status_label.setText(f"Server running on port {port}")
-            if self.start_server_button:
-                self.start_server_button.setText("Stop Server")
+            self.start_server_button.setText("Stop Server")
         except ValueError:
             self.main_window.show_error("Invalid port number.")
 
+    @Slot()
     def handle_connect_client(self):
         """Handles connecting to a remote server as a client."""
         # Implementation will depend on your remote client functionality
         # This placeholder would need to be completed based on your actual requirements
-        if not self.ip_input or not self.port_input:
-            self.main_window.show_error("IP or port input fields not found in UI.")
-            return
-            
         ip = self.ip_input.text().strip()
         port_str = self.port_input.text().strip()
         
@@ -80,7 +86,6 @@ class PySideRemoteController:
             # Update UI
             if self.remote_status_label:
                 self.remote_status_label.setText(f"Connected to {ip}:{port}")
-            if self.connect_client_button:
-                self.connect_client_button.setText("Disconnect")
+            self.connect_client_button.setText("Disconnect")
         except ValueError:
             self.main_window.show_error("Invalid port number.")
\ No newline at end of file
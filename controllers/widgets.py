@@ -0,0 +1,55 @@
+def bind_widgets(main_window, spec: dict, base_type) -> dict:
+    """
+    Looks up several named child widgets at once.
+
+    Forms loaded with uic.loadUi expose their widgets as attributes of the
+    window, and compiled forms (setupUi) expose them on ``main_window.ui``;
+    those are plain attribute reads. Anything not found that way is looked up
+    with a single walk of the object tree, instead of one findChild traversal
+    per widget.
+
+    Args:
+        main_window: The window whose descendants are searched.
+        spec (dict[str, type]): Maps object names to the expected widget types.
+        base_type (type): The framework's QObject class (PyQt6 or PySide6), so this
+            helper stays free of Qt imports.
+
+    Returns:
+        dict: Object name -> widget, or None when no matching widget exists
+        (mirroring findChild).
+    """
+    found = {}
+    for namespace in (getattr(main_window, "ui", None), main_window):
+        if namespace is None:
+            continue
+        for name, widget_type in spec.items():
+            if name not in found:
+                widget = getattr(namespace, name, None)
+                if isinstance(widget, widget_type) and widget.objectName() == name:
+                    found[name] = widget
+
+    if len(found) < len(spec):
+        for child in main_window.findChildren(base_type):
+            name = child.objectName()
+            if name in spec and name not in found and isinstance(child, spec[name]):
+                found[name] = child
+    return {name: found.get(name) for name in spec}
+
+
+def rows_in_selection(view) -> set:
+    """
+    Returns the rows touched by a view's selection.
+    Reads the selection's ranges rather than selectedIndexes(), which yields
+    one index per selected cell. Unlike selectionModel().selectedRows(), rows
+    that are only partly selected still count.
+
+    Args:
+        view: A QAbstractItemView (PyQt6 or PySide6).
+
+    Returns:
+        set[int]: The selected row numbers.
+    """
+    rows = set()
+    for selection_range in view.selectionModel().selection():
+        rows.update(range(selection_range.top(), selection_range.bottom() + 1))
+    return rows
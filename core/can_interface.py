@@ -1,13 +1,74 @@
 import can
 import logging
+import select
+import socket
+import struct
 import threading
-from queue import Queue
+from collections import deque
 from can import Bus, Message
+from core.socketcan_rx import BatchReceiver
+
+# Classic SocketCAN frame (struct can_frame): can_id with flag bits, length, padding, 8 data bytes
+CAN_FRAME = struct.Struct("=IB3x8s")
+# can_id bits holding the identifier; the top three bits are the EFF/RTR/ERR flags
+CAN_ID_MASK = 0x1FFFFFFF
+CAN_EFF_FLAG = 0x80000000
+CAN_RTR_FLAG = 0x40000000
+CAN_ERR_FLAG = 0x20000000
+# can_mask comparing every bit of a standard 11-bit ID
+CAN_SFF_MASK = 0x7FF
+# Most filters the kernel accepts on one CAN_RAW socket; beyond that everything is received
+CAN_RAW_FILTER_MAX = 512
+# Frames drained from the kernel socket buffer per recvmmsg call
+RECEIVE_BATCH_SIZE = 64
+
+
+class Frame:
+    """
+    A received or sent CAN frame, reduced to the fields the monitor reads.
+    Much cheaper to build than a can.Message, whose frame-type attributes it mirrors.
+    """
+    __slots__ = ("arbitration_id", "data", "flags")
+
+    def __init__(self, arbitration_id, data, flags=0):
+        self.arbitration_id = arbitration_id
+        self.data = data
+        # The EFF/RTR/ERR bits of the SocketCAN can_id
+        self.flags = flags
+
+    @property
+    def is_extended_id(self):
+        return bool(self.flags & CAN_EFF_FLAG)
+
+    @property
+    def is_remote_frame(self):
+        return bool(self.flags & CAN_RTR_FLAG)
+
+    @property
+    def is_error_frame(self):
+        return bool(self.flags & CAN_ERR_FLAG)
+
+
+def _frame(can_id, length, data):
+    """Builds a Frame from an unpacked SocketCAN can_frame, keeping its flag bits."""
+    flags = can_id & ~CAN_ID_MASK
+    if flags & CAN_RTR_FLAG:
+        # A remote frame's length is the requested DLC; it carries no data
+        return Frame(can_id & CAN_ID_MASK, b"", flags)
+    return Frame(can_id & CAN_ID_MASK, data[:length], flags)
+
 
 class CANInterface:
     """
     Manages the CAN interface connection and communication.
     """
+    # Received frames buffered for the consumer; once full, the oldest are dropped
+    RECEIVE_QUEUE_SIZE = 100_000
+    # Reusable outgoing messages; more are created if several threads send at once
+    MESSAGE_POOL_SIZE = 8
+    # Kernel receive buffer for the CAN_RAW socket, so bursts queue up while the receive
+    # thread is descheduled; the kernel caps it at net.core.rmem_max
+    SOCKET_RECEIVE_BUFFER = 1024 * 1024
 
     def __init__(self):
         self.channel = None
@@ -15,9 +76,15 @@ class CANInterface:
         self.connected = False
         self.bus = None
         self.receive_thread = None
-        self.receive_queue = Queue()
-        self.tx_queue = Queue()
+        # Single producer (the receive thread) and single consumer; deque append/popleft are atomic
+        self.receive_queue = deque(maxlen=self.RECEIVE_QUEUE_SIZE)
+        # Sent frames for the monitor; senders only append and the monitor only pops, so no lock is needed
+        self.tx_queue = deque()
+        # Outgoing messages are refilled in place rather than built per send
+        self._message_pool = [Message(is_extended_id=False) for _ in range(self.MESSAGE_POOL_SIZE)]
         self.receiving = False  # Flag to control receiving loop
+        # FilterManager revision last pushed to the bus as kernel filters; None if never
+        self.filter_revision = None
 
     def connect(self, channel, bitrate):
         """
@@ -27,13 +94,26 @@ class CANInterface:
             self.channel = channel
             self.bitrate = bitrate
             self.bus = Bus(interface="socketcan", channel=self.channel, bitrate=self.bitrate)
+            self._tune_socket()
             self.connected = True
+            # A new bus receives everything until the filters are pushed again
+            self.filter_revision = None
             return True
         except Exception as e:
             logging.error(f"Failed to connect to CAN channel '{channel}': {e}")
             self.connected = False
             return False
 
+    def _tune_socket(self):
+        """Enlarges the receive buffer of the bus's raw socket, when the bus exposes one."""
+        sock = getattr(self.bus, "socket", None)
+        if not isinstance(sock, socket.socket):
+            return
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.SOCKET_RECEIVE_BUFFER)
+        except OSError as e:
+            logging.warning(f"Could not enlarge the CAN socket receive buffer: {e}")
+
     def disconnect(self):
         """
         Disconnects from the CAN interface.
@@ -61,17 +141,47 @@ class CANInterface:
         Sends a CAN message.
         Args:
             message_id (int): The message ID.
-            data (list[int]): The message data as a list of bytes.
+            data (bytes | list[int]): The message data bytes.
         """
         if not self.connected or not self.bus:
             raise ConnectionError("CAN interface is not connected.")
+        pool = self._message_pool
+        try:
+            msg = pool.pop()
+        except IndexError:
+            msg = Message(is_extended_id=False)
         try:
-            msg = Message(arbitration_id=message_id, data=data, is_extended_id=False)
+            msg.arbitration_id = message_id
+            msg.data[:] = data
+            msg.dlc = len(msg.data)
+            # bus.send copies the frame to the kernel before returning, so the message can be reused
             self.bus.send(msg)
-            self.tx_queue.put(msg)
+            # The monitor gets its own snapshot, since the message is refilled by the next send
+            self.tx_queue.append(Frame(message_id, bytes(msg.data)))
         except Exception as e:
             logging.error(f"Failed to send message: {e}")
             raise
+        finally:
+            pool.append(msg)
+
+    def set_id_filters(self, ids, revision=None):
+        """
+        Restricts reception to the given standard IDs in the kernel (CAN_RAW_FILTER on socketcan),
+        so other frames never wake the receive thread. Data masks are still checked in user space.
+        Args:
+            ids (list[int]): The IDs to receive; empty (or more than the kernel takes) to receive every frame.
+            revision (int | None): The filter revision the IDs come from, recorded in filter_revision.
+        """
+        if not self.connected or not self.bus:
+            return
+        filters = None
+        if 0 < len(ids) <= CAN_RAW_FILTER_MAX:
+            filters = [{"can_id": can_id, "can_mask": CAN_SFF_MASK, "extended": False} for can_id in ids]
+        try:
+            self.bus.set_filters(filters)
+        except Exception as e:
+            logging.error(f"Failed to set receive filters: {e}")
+        self.filter_revision = revision
 
     def start_receiving(self):
         """
@@ -101,11 +211,92 @@ class CANInterface:
         """
         Receives messages and puts them in the queue.
         """
+        sock = getattr(self.bus, "socket", None)
+        if isinstance(sock, socket.socket):
+            if BatchReceiver.available():
+                self._receive_batch_loop(sock)
+            else:
+                self._receive_raw_loop(sock)
+            return
+        # Bind the per-frame calls once; this loop runs for every frame on the bus
+        recv = self.bus.recv
+        append = self.receive_queue.append
         try:
             while self.receiving:
-                msg = self.bus.recv(timeout=1)
+                msg = recv(timeout=1)
                 if msg is not None:
-                    self.receive_queue.put(msg)
+                    append(msg)
+        except Exception as e:
+            if self.receiving:
+                logging.error(f"Error in receive loop: {e}")
+
+    def _receive_batch_loop(self, sock):
+        """
+        Receives frames straight from the SocketCAN socket, draining up to
+        RECEIVE_BATCH_SIZE of them per recvmmsg call into one reused buffer.
+        Only waits in select once the socket is drained.
+        """
+        receiver = BatchReceiver(sock, CAN_FRAME.size, RECEIVE_BATCH_SIZE)
+        receive = receiver.receive
+        length_of = receiver.length
+        buffer = receiver.buffer
+        frame_size = CAN_FRAME.size
+        unpack = CAN_FRAME.unpack_from
+        append = self.receive_queue.append
+        wait = select.select
+        watched = [sock]
+        dont_wait = socket.MSG_DONTWAIT
+        try:
+            while self.receiving:
+                try:
+                    count = receive(dont_wait)
+                except BlockingIOError:
+                    # Drained; wait with a timeout so stop_receiving is noticed
+                    wait(watched, [], [], 1)
+                    continue
+                for i in range(count):
+                    if length_of(i) < frame_size:
+                        continue  # Not a classic CAN frame
+                    can_id, length, data = unpack(buffer, i * frame_size)
+                    if can_id <= CAN_ID_MASK:
+                        # No flag bits: a standard data frame, the common case
+                        append(Frame(can_id, data[:length]))
+                    else:
+                        append(_frame(can_id, length, data))
+        except Exception as e:
+            if self.receiving:
+                logging.error(f"Error in receive loop: {e}")
+
+    def _receive_raw_loop(self, sock):
+        """
+        Receives frames straight from the SocketCAN socket into one reused buffer,
+        bypassing python-can's per-frame message construction. Reads without blocking
+        while frames are pending and only waits in select once the socket is drained.
+        """
+        buffer = bytearray(CAN_FRAME.size)
+        frame_size = CAN_FRAME.size
+        unpack = CAN_FRAME.unpack_from
+        recv_into = sock.recv_into
+        append = self.receive_queue.append
+        wait = select.select
+        watched = [sock]
+        dont_wait = socket.MSG_DONTWAIT
+        try:
+            while self.receiving:
+                try:
+                    received = recv_into(buffer, frame_size, dont_wait)
+                except BlockingIOError:
+                    # Drained; wait with a timeout so stop_receiving is noticed
+                    wait(watched, [], [], 1)
+                    continue
+                if received < frame_size:
+                    continue  # Not a classic CAN frame
+                can_id, length, data = unpack(buffer)
+                if can_id <= CAN_ID_MASK:
+                    # No flag bits: a standard data frame, the common case
+                    append(Frame(can_id, data[:length]))
+                else:
+                    append(_frame(can_id, length, data))
         except Exception as e:
             if self.receiving:
                 logging.error(f"Error in receive loop: {e}")
@@ -114,8 +305,35 @@ class CANInterface:
         """
         Retrieves a message from the receive queue.
         Returns:
-            Message: A CAN message object.
+            Frame | Message: The received frame, or None if the queue is empty.
+        """
+        try:
+            return self.receive_queue.popleft()
+        except IndexError:
+            return None
+
+    def get_received_messages(self, max_count):
+        """
+        Retrieves up to max_count messages from the receive queue in one call.
+        Args:
+            max_count (int): The most messages to return.
+        Returns:
+            list[Frame | Message]: The oldest queued messages, in order; empty if none are queued.
+        """
+        queue = self.receive_queue
+        # The receive thread only ever adds frames (or evicts the oldest once full),
+        # so every frame counted here is still there to pop
+        popleft = queue.popleft
+        return [popleft() for _ in range(min(max_count, len(queue)))]
+
+    def get_sent_messages(self, max_count):
+        """
+        Retrieves up to max_count sent frames from the tx queue in one call.
+        Args:
+            max_count (int): The most frames to return.
+        Returns:
+            list[Frame]: The oldest queued frames, in order; empty if none are queued.
         """
-        if not self.receive_queue.empty():
-            return self.receive_queue.get()
-        return None
+        queue = self.tx_queue
+        popleft = queue.popleft
+        return [popleft() for _ in range(min(max_count, len(queue)))]
@@ -1,43 +1,173 @@
 import logging
+from functools import lru_cache
+from typing import Optional
 from core.utils import parse_value
 
+# Number of standard 11-bit CAN IDs
+ID_SPACE = 0x800
+# Per-ID match states kept in FilterManager.id_states
+NO_FILTER = 0       # No filter for this ID: frames are rejected
+CHECK_MASKS = 1     # Frames must pass one of the ID's masks
+ANY_DATA = 2        # An all-zero mask: frames pass whatever their data
+
+
+@lru_cache(maxsize=1024)
+def _parse_mask_string(mask: str) -> tuple:
+    """Parses a space-separated mask string; memoized, since the same masks are entered and removed repeatedly."""
+    return tuple(parse_value(byte) for byte in mask.split())
+
+
 class FilterManager:
     """
     Manages CAN message filters, allowing addition, removal, and validation.
     All numeric inputs are accepted as strings (hex, binary, or decimal).
+
+    The filters form an allow-list for received frames:
+
+    - With no filters defined, every frame matches.
+    - Once any filter exists, only frames whose ID has a filter match; every other ID is hidden.
+    - A frame matches a filter when its ID equals the filter ID and every bit set in the
+      filter's mask bytes is also set in the frame data. Missing data bytes count as 0,
+      and an all-zero mask accepts any data. Several filters on one ID match if any does.
+    - Filters are on standard 11-bit IDs, so extended-ID frames only match while no filter exists.
     """
 
-    def __init__(self):
-        # Each filter is stored as a dictionary: {'id': int, 'mask': list[int]}
-        self.filters = []
+    def __init__(self) -> None:
+        # Each filter is stored as a dictionary: {'id': int, 'mask': bytes},
+        # keyed by (id, tuple(mask)) in insertion order, so lookups by value are O(1)
+        self._by_key: dict = {}
+        # Lookup tables kept in step with the filters, so matching a frame is one
+        # bytearray index, plus a check of that ID's packed masks only when needed
+        self.id_states = bytearray(ID_SPACE)
+        self._masks_by_id: dict = {}
+        # ID -> keys of that ID's filters, in insertion order, so update_filter finds one without a scan
+        self._keys_by_id: dict = {}
+        # Bumped on every change, so the CAN interface can tell when to reapply its kernel filters
+        self.revision = 0
+
+    def _is_valid(self, parsed_id: int, parsed_mask: tuple) -> bool:
+        """Checks that a parsed filter fits a standard CAN frame."""
+        if not (0 <= parsed_id < ID_SPACE):
+            logging.warning("Invalid Filter ID: %s. Must be in range 0-0x7FF.", parsed_id)
+            return False
+        if len(parsed_mask) > 8 or any(b >> 8 for b in parsed_mask):
+            logging.warning("Invalid filter mask: %s. Must be at most 8 bytes of 0-0xFF.", parsed_mask)
+            return False
+        return True
+
+    @staticmethod
+    def _parse_mask(mask) -> tuple:
+        """Parses a space-separated mask string; lists of integers are taken as-is."""
+        if isinstance(mask, str):
+            return _parse_mask_string(mask)
+        return tuple(mask)
+
+    @staticmethod
+    def _pack_mask(mask: tuple) -> int:
+        return int.from_bytes(bytes(mask).ljust(8, b"\0"), "big")
+
+    def _insert(self, key: tuple) -> None:
+        """Adds a filter and its entry in the lookup tables used by matches()."""
+        parsed_id, parsed_mask = key
+        self._by_key[key] = {'id': parsed_id, 'mask': bytes(parsed_mask)}
+        self._masks_by_id.setdefault(parsed_id, []).append(self._pack_mask(parsed_mask))
+        self._keys_by_id.setdefault(parsed_id, []).append(key)
+        self._refresh_state(parsed_id)
+
+    def _discard(self, key: tuple) -> bool:
+        """Removes a filter and its entry in the lookup tables. Returns False if it is not present."""
+        if self._by_key.pop(key, None) is None:
+            return False
+        parsed_id, parsed_mask = key
+        masks = self._masks_by_id[parsed_id]
+        masks.remove(self._pack_mask(parsed_mask))
+        if not masks:
+            del self._masks_by_id[parsed_id]
+        keys = self._keys_by_id[parsed_id]
+        keys.remove(key)
+        if not keys:
+            del self._keys_by_id[parsed_id]
+        self._refresh_state(parsed_id)
+        return True
+
+    def _refresh_state(self, parsed_id: int) -> None:
+        """Recomputes the match state of one ID after its masks changed."""
+        self.revision += 1
+        masks = self._masks_by_id.get(parsed_id)
+        if not masks:
+            self.id_states[parsed_id] = NO_FILTER
+        elif 0 in masks:
+            self.id_states[parsed_id] = ANY_DATA
+        else:
+            self.id_states[parsed_id] = CHECK_MASKS
+
+    def matches(self, message_id: int, data, is_extended_id: bool = False) -> bool:
+        """
+        Checks whether a received frame passes the current filters.
+        Filters are on standard IDs, so an extended frame only passes while no filter is set.
+
+        Args:
+            message_id (int): The frame's arbitration ID.
+            data (bytes): The frame's data bytes.
+            is_extended_id (bool): Whether the ID is a 29-bit extended ID.
+
+        Returns:
+            bool: True if the frame should be shown.
+        """
+        if not self._by_key:
+            return True
+        if is_extended_id:
+            return False
+        state = self.id_states[message_id] if 0 <= message_id < ID_SPACE else NO_FILTER
+        if state != CHECK_MASKS:
+            return state == ANY_DATA
+        packed_data = int.from_bytes(bytes(data[:8]).ljust(8, b"\0"), "big")
+        return any(packed_data & m == m for m in self._masks_by_id[message_id])
 
-    def add_filter(self, filter_id: str, mask: str) -> bool:
+    def add_filter(self, filter_id: str, mask) -> Optional[dict]:
         """
         Adds a filter to the list.
 
         Args:
             filter_id (str): The filter ID in hex, binary, or decimal format.
-            mask (str): The mask bytes as a space-separated string (e.g., "0xFF 0x0F").
+            mask: Either a space-separated string (e.g., "0xFF 0x0F") or an
+                already-parsed list of integers.
 
         Returns:
-            bool: True if successfully added, False if invalid or duplicate.
+            dict | None: The stored filter if successfully added, None if invalid or duplicate.
         """
         try:
             parsed_id = parse_value(filter_id)
-            parsed_mask = [parse_value(byte) for byte in mask.split()]
+            parsed_mask = self._parse_mask(mask)
+        except ValueError as e:
+            logging.error("Error parsing filter: %s", e)
+            return None
+        return self.add_filter_parsed(parsed_id, parsed_mask)
 
-            # Check for duplicates
-            for f in self.filters:
-                if f['id'] == parsed_id and f['mask'] == parsed_mask:
-                    logging.warning(f"Duplicate filter detected: {f}")
-                    return False  # Duplicate filter
+    def add_filter_parsed(self, filter_id: int, mask) -> Optional[dict]:
+        """
+        Adds a filter from an already-parsed ID and mask, skipping the string parsing.
 
-            self.filters.append({'id': parsed_id, 'mask': parsed_mask})
-            logging.info(f"Filter added: ID={parsed_id}, Mask={parsed_mask}")
-            return True
-        except ValueError as e:
-            logging.error(f"Error parsing filter: {e}")
-            return False
+        Args:
+            filter_id (int): The filter ID.
+            mask (Sequence[int]): The mask bytes.
+
+        Returns:
+            dict | None: The stored filter if successfully added, None if invalid or duplicate.
+                It is the dict get_filters() lists, so callers can show it without copying the list.
+        """
+        parsed_mask = tuple(mask)
+        if not self._is_valid(filter_id, parsed_mask):
+            return None
+
+        key = (filter_id, parsed_mask)
+        if key in self._by_key:
+            logging.warning("Duplicate filter detected: %s", self._by_key[key])
+            return None  # Duplicate filter
+
+        self._insert(key)
+        logging.info("Filter added: ID=%s, Mask=%s", filter_id, parsed_mask)
+        return self._by_key[key]
 
     def remove_filter(self, filter_id: str, mask) -> bool:
         """
@@ -52,29 +182,36 @@ class FilterManager:
         """
         try:
             parsed_id = parse_value(filter_id)
-            
-            # Handle both string and list inputs for mask
-            if isinstance(mask, str):
-                parsed_mask = [parse_value(byte) for byte in mask.split()]
-            else:
-                # Already a list
-                parsed_mask = mask
-
-            for f in self.filters:
-                if f['id'] == parsed_id and f['mask'] == parsed_mask:
-                    self.filters.remove(f)
-                    logging.info(f"Filter removed: ID={parsed_id}, Mask={parsed_mask}")
-                    return True
-
-            logging.warning(f"Filter not found: ID={parsed_id}, Mask={parsed_mask}")
-            return False
+            parsed_mask = self._parse_mask(mask)
         except ValueError as e:
-            logging.error(f"Error removing filter: {e}")
+            logging.error("Error removing filter: %s", e)
             return False
+        return self.remove_filter_parsed(parsed_id, parsed_mask)
+
+    def remove_filter_parsed(self, filter_id: int, mask) -> bool:
+        """
+        Removes a filter given its already-parsed ID and mask.
+
+        Args:
+            filter_id (int): The filter ID.
+            mask (Sequence[int]): The mask bytes.
+
+        Returns:
+            bool: True if successfully removed, False otherwise.
+        """
+        parsed_mask = tuple(mask)
+        if self._discard((filter_id, parsed_mask)):
+            logging.info("Filter removed: ID=%s, Mask=%s", filter_id, parsed_mask)
+            return True
+
+        logging.warning("Filter not found: ID=%s, Mask=%s", filter_id, parsed_mask)
+        return False
 
     def update_filter(self, filter_id: str, mask: str) -> None:
         """
-        Updates a filter with a new mask.
+        Updates a filter with a new mask. The first filter on the ID is replaced and
+        moves to the end of get_filters(); the update is rejected if the ID already
+        has a filter with the new mask.
 
         Args:
             filter_id (str): The filter ID in hex, binary, or decimal format.
@@ -82,23 +219,38 @@ class FilterManager:
         """
         try:
             parsed_id = parse_value(filter_id)
-            parsed_mask = [parse_value(byte) for byte in mask.split()]
+            parsed_mask = _parse_mask_string(mask)
+            if not self._is_valid(parsed_id, parsed_mask):
+                return
             
-            for f in self.filters:
-                if f['id'] == parsed_id:
-                    f['mask'] = parsed_mask
-                    logging.info(f"Filter updated: ID={parsed_id}, Mask={parsed_mask}")
-                    return
-            logging.warning(f"Filter ID {parsed_id} not found. Adding as new.")
+            new_key = (parsed_id, parsed_mask)
+            if new_key in self._by_key:
+                logging.warning("Filter not updated: ID=%s already has Mask=%s", parsed_id, parsed_mask)
+                return
+            keys = self._keys_by_id.get(parsed_id)
+            if keys:
+                self._discard(keys[0])
+                self._insert(new_key)
+                logging.info("Filter updated: ID=%s, Mask=%s", parsed_id, parsed_mask)
+                return
+            logging.warning("Filter ID %s not found. Adding as new.", parsed_id)
             self.add_filter(filter_id, mask)
         except ValueError as e:
-            logging.error(f"Error updating filter: {e}")
+            logging.error("Error updating filter: %s", e)
+
+    def filtered_ids(self) -> list:
+        """Returns the IDs that have at least one filter, in ascending order."""
+        return sorted(self._masks_by_id)
 
     def get_filters(self):
         """Returns the list of filters."""
-        return self.filters
+        return list(self._by_key.values())
 
     def clear_filters(self):
         """Clears all filters."""
-        self.filters.clear()
+        self._by_key.clear()
+        self.id_states = bytearray(ID_SPACE)
+        self._masks_by_id = {}
+        self._keys_by_id = {}
+        self.revision += 1
         logging.info("All filters cleared.")
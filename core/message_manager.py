@@ -1,5 +1,6 @@
 import logging
-from core.utils import parse_value
+from array import array
+from core.utils import parse_value, parse_bytes
 
 class MessageManager:
     """
@@ -8,8 +9,59 @@ class MessageManager:
     """
 
     def __init__(self):
-        # Each message is stored as a dictionary: {'id': int, 'data': list[int], 'name': str}
-        self.messages = []
+        # Messages are stored column-wise; position i of every column describes the same message
+        self.names = []         # list[str]
+        self.ids = array('H')   # 11-bit message IDs
+        self.data = []          # list[bytes], at most 8 bytes each
+        # Indexes over the columns for O(1) lookups: name -> position, and every (id, data) pair
+        self._positions = {}
+        self._pairs = set()
+        # Bumped on every change, so views can skip refreshes when nothing changed
+        self.revision = 0
+        # get_messages() result and the revision it was built for
+        self._messages_view = []
+        self._view_revision = -1
+
+    def _reindex(self, start=0):
+        """Rebuilds the name positions from start onwards, after rows moved."""
+        positions = self._positions
+        names = self.names
+        for index in range(start, len(names)):
+            positions[names[index]] = index
+
+    def _parse(self, message_id: str, data: str):
+        """
+        Parses and validates a message ID and its data bytes.
+
+        Returns:
+            tuple | None: The ID (int) and data (bytes), or None if out of range.
+
+        Raises:
+            ValueError: If a value is malformed or a data byte is outside 0..255.
+        """
+        return self._validate(parse_value(message_id), parse_bytes(data.split()))
+
+    def _validate(self, parsed_id: int, parsed_data):
+        """
+        Validates an already-parsed message ID and its data bytes.
+
+        Returns:
+            tuple | None: The ID (int) and data (bytes), or None if out of range.
+
+        Raises:
+            ValueError: If a data byte is outside 0..255.
+        """
+        # Validate the message ID (for standard 11-bit CAN IDs)
+        if not (0 <= parsed_id <= 0x7FF):
+            logging.warning("Invalid Message ID: %s. Must be in range 0-0x7FF.", parsed_id)
+            return None
+
+        # Validate the data length
+        if len(parsed_data) > 8:
+            logging.warning("Message data exceeds 8 bytes.")
+            return None
+
+        return parsed_id, bytes(parsed_data)
 
     def add_message(self, name: str, message_id: str, data: str) -> bool:
         """
@@ -24,34 +76,51 @@ class MessageManager:
             bool: True if successfully added, False if invalid or duplicate.
         """
         try:
-            parsed_id = parse_value(message_id)
-            parsed_data = [parse_value(byte) for byte in data.split()]
-
-            # Validate the message ID (for standard 11-bit CAN IDs)
-            if not (0 <= parsed_id <= 0x7FF):
-                logging.warning(f"Invalid Message ID: {parsed_id}. Must be in range 0-0x7FF.")
-                return False
-
-            # Validate the data length
-            if len(parsed_data) > 8:
-                logging.warning("Message data exceeds 8 bytes.")
-                return False
-
-            # Check for duplicate name or duplicate message (ID and data)
-            for msg in self.messages:
-                if msg['name'] == name:
-                    logging.warning(f"Duplicate message name detected: {name}")
-                    return False  # Duplicate name
-                if msg['id'] == parsed_id and msg['data'] == parsed_data:
-                    logging.warning(f"Duplicate message detected: {msg}")
-                    return False  # Duplicate message
-
-            self.messages.append({'name': name, 'id': parsed_id, 'data': parsed_data})
-            logging.info(f"Message added: Name={name}, ID={parsed_id}, Data={parsed_data}")
-            return True
+            parsed = self._parse(message_id, data)
+        except ValueError as e:
+            logging.error("Error parsing message: %s", e)
+            return False
+        return parsed is not None and self._insert(name, parsed)
+
+    def add_message_parsed(self, name: str, message_id: int, data) -> bool:
+        """
+        Adds a message from an already-parsed ID and data, skipping the string parsing.
+
+        Args:
+            name (str): The name of the message.
+            message_id (int): The message ID.
+            data (bytes | list[int]): The data bytes.
+
+        Returns:
+            bool: True if successfully added, False if invalid or duplicate.
+        """
+        try:
+            parsed = self._validate(message_id, data)
         except ValueError as e:
-            logging.error(f"Error parsing message: {e}")
+            logging.error("Error parsing message: %s", e)
             return False
+        return parsed is not None and self._insert(name, parsed)
+
+    def _insert(self, name: str, parsed: tuple) -> bool:
+        """Appends a validated (id, data) message unless its name or its ID and data are taken."""
+        parsed_id, parsed_data = parsed
+
+        # Check for duplicate name or duplicate message (ID and data)
+        if name in self._positions:
+            logging.warning("Duplicate message name detected: %s", name)
+            return False  # Duplicate name
+        if parsed in self._pairs:
+            logging.warning("Duplicate message detected: ID=%s, Data=%s", parsed_id, parsed_data.hex(" "))
+            return False  # Duplicate message
+
+        self._positions[name] = len(self.names)
+        self._pairs.add(parsed)
+        self.names.append(name)
+        self.ids.append(parsed_id)
+        self.data.append(parsed_data)
+        self.revision += 1
+        logging.info("Message added: Name=%s, ID=%s, Data=%s", name, parsed_id, parsed_data.hex(" "))
+        return True
 
     def remove_message(self, name: str) -> bool:
         """
@@ -63,13 +132,44 @@ class MessageManager:
         Returns:
             bool: True if successfully removed, False otherwise.
         """
-        for msg in self.messages:
-            if msg['name'] == name:
-                self.messages.remove(msg)
-                logging.info(f"Message removed: Name={name}")
-                return True
-        logging.warning(f"Message not found: Name={name}")
-        return False
+        index = self._positions.pop(name, None)
+        if index is None:
+            logging.warning("Message not found: Name=%s", name)
+            return False
+        self._pairs.discard((self.ids[index], self.data[index]))
+        del self.names[index]
+        del self.ids[index]
+        del self.data[index]
+        self._reindex(index)
+        self.revision += 1
+        logging.info("Message removed: Name=%s", name)
+        return True
+
+    def remove_messages(self, names) -> list:
+        """
+        Removes several messages by name in a single pass over the columns.
+
+        Args:
+            names (Iterable[str]): The names of the messages to remove.
+
+        Returns:
+            list[str]: The names that were not found.
+        """
+        wanted = set(names)
+        removed = wanted.intersection(self._positions)
+        if removed:
+            keep = [i for i, name in enumerate(self.names) if name not in removed]
+            self.names = [self.names[i] for i in keep]
+            self.ids = array('H', [self.ids[i] for i in keep])
+            self.data = [self.data[i] for i in keep]
+            self._positions = {name: index for index, name in enumerate(self.names)}
+            self._pairs = set(zip(self.ids, self.data))
+            self.revision += 1
+            logging.info("Messages removed: Names=%s", sorted(removed))
+        missing = [name for name in wanted if name not in removed]
+        if missing:
+            logging.warning("Messages not found: Names=%s", sorted(missing))
+        return missing
 
     def update_message(self, name: str, message_id: str, data: str) -> None:
         """
@@ -81,25 +181,70 @@ class MessageManager:
             data (str): The new data bytes as a space-separated string.
         """
         try:
-            parsed_id = parse_value(message_id)
-            parsed_data = [parse_value(byte) for byte in data.split()]
-
-            for msg in self.messages:
-                if msg['name'] == name:
-                    msg['id'] = parsed_id
-                    msg['data'] = parsed_data
-                    logging.info(f"Message updated: Name={name}, ID={parsed_id}, Data={parsed_data}")
-                    return
-            logging.warning(f"Message with Name={name} not found. Adding as new.")
-            self.add_message(name, message_id, data)
+            parsed = self._parse(message_id, data)
         except ValueError as e:
-            logging.error(f"Error updating message: {e}")
+            logging.error("Error updating message: %s", e)
+            return
+        if parsed is not None:
+            self._update(name, parsed)
+
+    def update_message_parsed(self, name: str, message_id: int, data) -> None:
+        """
+        Updates a message from an already-parsed ID and data, skipping the string parsing.
+
+        Args:
+            name (str): The name of the message.
+            message_id (int): The new message ID.
+            data (bytes | list[int]): The new data bytes.
+        """
+        try:
+            parsed = self._validate(message_id, data)
+        except ValueError as e:
+            logging.error("Error updating message: %s", e)
+            return
+        if parsed is not None:
+            self._update(name, parsed)
+
+    def _update(self, name: str, parsed: tuple) -> None:
+        """Replaces a message's ID and data with a validated pair, adding the message if it is unknown."""
+        parsed_id, parsed_data = parsed
+        index = self._positions.get(name)
+        if index is None:
+            logging.warning("Message with Name=%s not found. Adding as new.", name)
+            self._insert(name, parsed)
+            return
+        old = (self.ids[index], self.data[index])
+        if parsed != old:
+            if parsed in self._pairs:
+                logging.warning("Duplicate message detected: ID=%s, Data=%s", parsed_id, parsed_data.hex(" "))
+                return
+            self._pairs.discard(old)
+            self._pairs.add(parsed)
+        self.ids[index] = parsed_id
+        self.data[index] = parsed_data
+        self.revision += 1
+        logging.info("Message updated: Name=%s, ID=%s, Data=%s", name, parsed_id, parsed_data.hex(" "))
 
     def get_messages(self):
-        """Returns the list of messages."""
-        return self.messages
+        """
+        Returns the messages as a list of dictionaries:
+        {'name': str, 'id': int, 'data': bytes}.
+        The list is rebuilt from the columns only after a change and must not be modified.
+        """
+        if self._view_revision != self.revision:
+            self._messages_view = [
+                {'name': name, 'id': message_id, 'data': data}
+                for name, message_id, data in zip(self.names, self.ids, self.data)
+            ]
+            self._view_revision = self.revision
+        return self._messages_view
 
     def clear_messages(self):
         """Clears all messages."""
-        self.messages.clear()
+        self.names.clear()
+        del self.ids[:]
+        self.data.clear()
+        self._positions.clear()
+        self._pairs.clear()
+        self.revision += 1
         logging.info("All messages cleared.")
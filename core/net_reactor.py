@@ -0,0 +1,294 @@
+import logging
+import selectors
+import socket
+import threading
+from collections import deque
+from itertools import islice
+from core.remote_protocol import FrameReader
+
+
+class _Peer:
+    """Per-socket state kept by the reactor."""
+    __slots__ = ("reader", "on_message", "on_close", "output", "queued", "dropped")
+
+    def __init__(self, reader, on_message, on_close):
+        self.reader = reader
+        self.on_message = on_message
+        self.on_close = on_close
+        # Buffers queued by write() that the kernel has not accepted yet, and their total size
+        self.output = deque()
+        self.queued = 0
+        self.dropped = 0
+
+
+class _Listener:
+    """State kept by the reactor for a listening socket."""
+    __slots__ = ("on_accept",)
+
+    def __init__(self, on_accept):
+        self.on_accept = on_accept
+
+
+class Reactor(threading.Thread):
+    """
+    Single network thread that waits on every registered socket with one selector,
+    accepts connections on listening sockets, hands the framed messages read from
+    each connected socket to its callbacks and writes queued output without blocking. A socket is only watched for writability while
+    it has output left over. Sockets stay in blocking mode, so other threads can
+    still write to them directly with sendall.
+    """
+    # Receive buffer per socket; one read usually drains everything the kernel has buffered
+    READ_SIZE = 65536
+    # Output queued per socket; frames written beyond this are dropped for that socket
+    MAX_OUTPUT = 4 * 1024 * 1024
+    # Buffers handed to one sendmsg call; Linux accepts at most 1024 (IOV_MAX)
+    MAX_IOVECS = 1024
+
+    def __init__(self):
+        super().__init__(name="net-reactor", daemon=True)
+        self._selector = selectors.DefaultSelector()
+        # Registrations, writes and closes requested by other threads, applied on the reactor thread.
+        # The lists are emptied in place, so they can be passed around as queues.
+        self._pending = []
+        self._pending_writes = []
+        self._pending_closes = []
+        self._lock = threading.Lock()
+        self._wakeup_r, self._wakeup_w = socket.socketpair()
+        self._wakeup_r.setblocking(False)
+        # Wakeup bytes are drained into this buffer; their content is never looked at
+        self._wakeup_buffer = bytearray(4096)
+        self._wakeup_w.setblocking(False)
+        self._selector.register(self._wakeup_r, selectors.EVENT_READ)
+
+    def register(self, sock, on_message, on_close=None):
+        """
+        Starts reading framed messages from a connected socket. Safe to call from any thread.
+
+        Args:
+            sock (socket.socket): The connected socket.
+            on_message (Callable[[dict], None]): Called on the reactor thread for each message.
+            on_close (Callable[[], None] | None): Called on the reactor thread once the peer
+                disconnects, the socket is shut down, or the stream becomes unreadable.
+        """
+        self._queue(self._pending, (sock, _Peer(FrameReader(self.READ_SIZE), on_message, on_close)))
+
+    def listen(self, sock, on_accept):
+        """
+        Starts accepting connections on a listening socket. Safe to call from any thread.
+
+        Args:
+            sock (socket.socket): The bound, listening socket; it is switched to non-blocking mode.
+            on_accept (Callable[[socket.socket, tuple], None]): Called on the reactor thread
+                with each accepted (blocking) socket and its peer address.
+        """
+        sock.setblocking(False)
+        self._queue(self._pending, (sock, _Listener(on_accept)))
+
+    def close(self, sock):
+        """Stops watching a socket and closes it on the reactor thread. Safe to call from any thread."""
+        self._queue(self._pending_closes, sock)
+
+    def write(self, sock, data):
+        """
+        Queues bytes for a registered socket; the reactor thread writes them without
+        blocking. Safe to call from any thread. Writes from one thread are sent in order,
+        and each call is either queued whole or dropped whole if the socket is too far
+        behind, so framing is preserved.
+
+        Args:
+            sock (socket.socket): A socket previously passed to register.
+            data (bytes): The bytes to send.
+        """
+        self._queue(self._pending_writes, (sock, data))
+
+    def _queue(self, queue, item):
+        with self._lock:
+            wake = not (self._pending or self._pending_writes or self._pending_closes)
+            queue.append(item)
+        # Only the first request since the last drain needs a wakeup
+        if wake:
+            self._wake()
+
+    def _wake(self):
+        try:
+            self._wakeup_w.send(b"\0")
+        except BlockingIOError:
+            pass  # A wakeup is already pending
+
+    def run(self):
+        select = self._selector.select
+        while True:
+            for key, events in select():
+                # One failing socket must not stop the thread that serves every other connection
+                try:
+                    if key.fileobj is self._wakeup_r:
+                        self._apply_pending()
+                        continue
+                    if type(key.data) is _Listener:
+                        self._accept(key.fileobj, key.data)
+                        continue
+                    if events & selectors.EVENT_WRITE:
+                        self._flush(key.fileobj, key.data)
+                    if events & selectors.EVENT_READ:
+                        self._read(key)
+                except Exception as e:
+                    logging.error(f"Error serving socket {key.fd}: {e}")
+
+    def _apply_pending(self):
+        try:
+            while self._wakeup_r.recv_into(self._wakeup_buffer):
+                pass
+        except BlockingIOError:
+            pass
+        with self._lock:
+            pending = self._pending.copy()
+            writes = self._pending_writes.copy()
+            closes = self._pending_closes.copy()
+            self._pending.clear()
+            self._pending_writes.clear()
+            self._pending_closes.clear()
+        for sock, data in pending:
+            try:
+                self._selector.register(sock, selectors.EVENT_READ, data)
+            except (ValueError, OSError) as e:
+                # The socket was closed before the reactor got to it
+                logging.error(f"Cannot watch socket: {e}")
+                if type(data) is _Peer:
+                    self._notify_closed(data)
+
+        # Queue everything first, so a broadcast reaches each socket as a single send
+        flush = set()
+        get_key = self._selector.get_key
+        for sock, data in writes:
+            try:
+                peer = get_key(sock).data
+            except (KeyError, ValueError):
+                continue  # Already disconnected
+            if peer.queued + len(data) > self.MAX_OUTPUT:
+                peer.dropped += 1
+                if peer.dropped == 1:
+                    # Reported once per socket; later drops are only counted
+                    logging.warning(f"Peer {sock.fileno()} is not keeping up; dropping output.")
+                continue
+            # Queued by reference; the same broadcast buffer is shared by every peer
+            peer.output.append(data)
+            peer.queued += len(data)
+            flush.add(sock)
+        for sock in flush:
+            try:
+                key = get_key(sock)
+            except (KeyError, ValueError):
+                continue  # Closed by an earlier flush in this round
+            if not key.events & selectors.EVENT_WRITE:
+                # Otherwise the socket is already waiting to become writable
+                self._flush(sock, key.data)
+
+        for sock in closes:
+            try:
+                self._selector.unregister(sock)
+            except (KeyError, ValueError):
+                pass  # Never registered, or already gone
+            sock.close()
+
+    def _accept(self, sock, listener):
+        """Accepts every connection waiting on a listening socket."""
+        while True:
+            try:
+                conn, addr = sock.accept()
+            except BlockingIOError:
+                return
+            except OSError as e:
+                logging.error(f"Error accepting client: {e}")
+                return
+            # Connections are served in blocking mode, like every other registered socket
+            conn.setblocking(True)
+            try:
+                listener.on_accept(conn, addr)
+            except Exception as e:
+                logging.error(f"Error accepting client: {e}")
+                conn.close()
+
+    def _flush(self, sock, peer):
+        """
+        Writes as much queued output as the kernel takes, gathered into one sendmsg call,
+        and watches for writability if any is left.
+        """
+        output = peer.output
+        try:
+            sent = sock.sendmsg(list(islice(output, self.MAX_IOVECS)), (), socket.MSG_DONTWAIT)
+        except BlockingIOError:
+            sent = 0
+        except OSError as e:
+            logging.error(f"Error writing to {sock.fileno()}: {e}")
+            self._close(sock, peer)
+            return
+        peer.queued -= sent
+        while sent:
+            length = len(output[0])
+            if length > sent:
+                output[0] = memoryview(output[0])[sent:]
+                break
+            output.popleft()
+            sent -= length
+        events = selectors.EVENT_READ | selectors.EVENT_WRITE if output else selectors.EVENT_READ
+        try:
+            if self._selector.get_key(sock).events != events:
+                self._selector.modify(sock, events, peer)
+        except (KeyError, ValueError, OSError) as e:
+            # Closed underneath the reactor, e.g. by another thread
+            logging.error(f"Lost socket {sock.fileno()} while writing: {e}")
+            self._close(sock, peer)
+
+    def _close(self, sock, peer):
+        try:
+            self._selector.unregister(sock)
+        except (KeyError, ValueError):
+            pass  # Already unregistered
+        peer.output.clear()
+        peer.queued = 0
+        self._notify_closed(peer)
+
+    @staticmethod
+    def _notify_closed(peer):
+        if peer.on_close:
+            try:
+                peer.on_close()
+            except Exception as e:
+                logging.error(f"Error handling remote disconnect: {e}")
+
+    def _read(self, key):
+        sock = key.fileobj
+        peer = key.data
+        current = self._selector.get_map().get(key.fd)
+        if current is None or current.data is not peer:
+            return  # Closed by a failed write in this round
+        try:
+            messages = peer.reader.recv_from(sock)
+        except (OSError, ValueError) as e:
+            logging.error(f"Error reading from {key.fd}: {e}")
+            messages = None
+
+        if messages is None:
+            self._close(sock, peer)
+            return
+
+        on_message = peer.on_message
+        for msg in messages:
+            try:
+                on_message(msg)
+            except Exception as e:
+                logging.error(f"Error handling remote message: {e}")
+
+
+_reactor = None
+_reactor_lock = threading.Lock()
+
+
+def get_reactor() -> Reactor:
+    """Returns the process-wide reactor, starting it on first use."""
+    global _reactor
+    with _reactor_lock:
+        if _reactor is None:
+            _reactor = Reactor()
+            _reactor.start()
+        return _reactor
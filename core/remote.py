@@ -0,0 +1,260 @@
+import logging
+import socket
+import threading
+from core.net_reactor import get_reactor
+from core.remote_protocol import batch_frame, encode_frame, send_frame
+
+
+def tune_socket(sock, buffer_size, send_buffer_size=None):
+    """
+    Disables Nagle's algorithm and delayed ACKs and sizes the kernel buffers of a stream socket.
+
+    Args:
+        sock (socket.socket): The stream socket.
+        buffer_size (int): Receive buffer size, also used for sending unless send_buffer_size is given.
+        send_buffer_size (int | None): Send buffer size.
+    """
+    # Frames are small and latency-sensitive; don't let Nagle hold them back
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    if hasattr(socket, "TCP_QUICKACK"):
+        # Linux only; the kernel may fall back to delayed ACKs later, but it covers the connection start
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, send_buffer_size or buffer_size)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, buffer_size)
+
+
+class ClientConnection:
+    """
+    A connected client. Its socket is read and written by the shared network reactor:
+    broadcasts are queued there without blocking, so a slow client never stalls the
+    caller of broadcast_message.
+    """
+
+    def __init__(self, sock, addr):
+        self.sock = sock
+        self.addr = addr
+        # Registry key; captured now since fileno() is -1 once the socket is closed
+        self.fd = sock.fileno()
+
+    def shutdown(self):
+        """Shuts the connection down without closing the socket, which the reader still owns."""
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+    def close(self):
+        """Closes the socket."""
+        try:
+            self.sock.close()
+        except OSError:
+            pass
+
+
+class RemoteServer:
+    # Kernel receive buffer size for client sockets; commands from clients are small
+    SOCKET_BUFFER_SIZE = 256 * 1024
+    # Kernel send buffer size for client sockets, so broadcast bursts to a slow client fit without waiting on the reactor
+    SEND_BUFFER_SIZE = 1024 * 1024
+
+    def __init__(self, port, can_interface):
+        """
+        :param port: TCP port to listen on.
+        :param can_interface: The local CAN interface object to use for sending messages.
+        """
+        self.port = port
+        self.can_interface = can_interface
+        # Connected clients keyed by socket fd, for O(1) removal; added and removed on the reactor thread
+        self._clients = {}
+        self._clients_lock = threading.Lock()
+        self.server_socket = None
+        self.running = False
+
+    def start(self):
+        if self.running:
+            return
+        self.running = True
+        self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        # Allow address reuse
+        self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        # Accepted sockets inherit the receive buffer, which sizes the window offered during the handshake
+        self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.SOCKET_BUFFER_SIZE)
+        self.server_socket.bind(('', self.port))
+        # Full kernel accept backlog; the reactor drains every pending connection per wakeup
+        self.server_socket.listen(socket.SOMAXCONN)
+        # Connections are accepted on the shared network reactor thread, which also serves the clients
+        get_reactor().listen(self.server_socket, self.accept_client)
+        logging.info(f"Remote server started on port {self.port}.")
+
+    def accept_client(self, client_socket, addr):
+        """Sets up a connection accepted by the reactor."""
+        if not self.running:
+            client_socket.close()
+            return
+        tune_socket(client_socket, self.SOCKET_BUFFER_SIZE, self.SEND_BUFFER_SIZE)
+        logging.info(f"Client connected from {addr}.")
+        client = ClientConnection(client_socket, addr)
+        with self._clients_lock:
+            self._clients[client.fd] = client
+        # Incoming commands are read on the shared network reactor thread
+        get_reactor().register(
+            client_socket,
+            lambda msg, sock=client_socket: self.handle_command(msg, sock),
+            lambda client=client: self.handle_client_closed(client),
+        )
+
+    def handle_client_closed(self, client):
+        """Removes a client once the reactor sees its connection end."""
+        with self._clients_lock:
+            # The fd may already belong to a newer connection if this one was dropped by stop()
+            if self._clients.get(client.fd) is client:
+                del self._clients[client.fd]
+        client.close()
+        logging.info("Client disconnected.")
+
+    def handle_command(self, command, client_socket):
+        """
+        Process a command sent by a remote client.
+        For now, we support a 'send_message' command.
+        Expected command format (a msgpack map):
+          { "cmd": "send_message", "data": { "id": "0x123", "data": "0x01 0x02 ..." } }
+        The ID may also be sent as an integer and the data as raw bytes, which skips the text parsing:
+          { "cmd": "send_message", "data": { "id": 0x123, "data": b"\\x01\\x02" } }
+        """
+        if command.get("cmd") == "send_message":
+            msg_data = command.get("data")
+            if msg_data:
+                try:
+                    message_id = msg_data.get("id")
+                    if not isinstance(message_id, int):
+                        message_id = int(message_id, 0)
+                    data_bytes = msg_data.get("data")
+                    if not isinstance(data_bytes, bytes):
+                        # Assume the data is a space‐separated string of numbers (in hex, binary, or decimal)
+                        data_bytes = [int(b, 0) for b in data_bytes.split()]
+                    self.can_interface.send_message(message_id, data_bytes)
+                    # Once per remote command; lazy %-formatting costs nothing unless debug logging is on
+                    logging.debug("Remote server sent message: ID %#x, Data %s", message_id, data_bytes)
+                except Exception as e:
+                    logging.error(f"Error processing send_message command: {e}")
+        else:
+            logging.warning("Received unknown command from client.")
+
+    def broadcast_message(self, message):
+        """
+        Broadcast a CAN message (as a dictionary) to all connected clients.
+        Expected message format (for example):
+           { "timestamp": "2023-05-01 12:34:56.789",
+             "type": "Rx",
+             "id": "0x123",
+             "data": ["0x01", "0x02", ...] }
+        """
+        if self._clients:
+            self.send_to_all(encode_frame(message))
+
+    def broadcast_rows(self, rows):
+        """
+        Broadcast monitor rows to all connected clients as a single batch frame.
+        Each row is a (timestamp_ns, type, id, data) tuple, sent without formatting.
+        """
+        # Nothing is packed or encoded while no client is connected
+        if rows and self._clients:
+            self.send_to_all(encode_frame(batch_frame(rows)))
+
+    def send_to_all(self, frame):
+        """Queues an encoded frame for every connected client."""
+        # Encoded once by the caller; the reactor writes it to every client after a single wakeup
+        write = get_reactor().write
+        with self._clients_lock:
+            clients = list(self._clients.values())
+        for client in clients:
+            write(client.sock, frame)
+
+    def stop(self):
+        self.running = False
+        if self.server_socket:
+            # Closed on the reactor thread, which still watches it
+            get_reactor().close(self.server_socket)
+        with self._clients_lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            # The reactor sees the shutdown as a disconnect and closes the client
+            client.shutdown()
+        logging.info("Remote server stopped.")
+
+
+class RemoteConnection:
+    """
+    Connects to a RemoteServer and passes every streamed message to a callback.
+    Messages are read on the shared network reactor thread, so the callback runs there.
+    """
+    # Kernel send/receive buffer size; set before connect so the TCP window can use it
+    SOCKET_BUFFER_SIZE = 256 * 1024
+
+    def __init__(self, host, port, on_message):
+        """
+        Args:
+            host (str): The server's address.
+            port (int): The server's TCP port.
+            on_message (Callable[[dict], None]): Called on the reactor thread for each message.
+        """
+        self.host = host
+        self.port = port
+        self.on_message = on_message
+        self.socket = None
+        self.running = False
+        self.connect_thread = None
+
+    def start(self):
+        """Connects in the background, then hands the socket to the reactor."""
+        self.running = True
+        self.connect_thread = threading.Thread(target=self.connect_to_server, daemon=True)
+        self.connect_thread.start()
+
+    def connect_to_server(self):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            tune_socket(sock, self.SOCKET_BUFFER_SIZE)
+            sock.connect((self.host, self.port))
+        except OSError as e:
+            logging.error(f"Remote client error: {e}")
+            sock.close()
+            self.running = False
+            return
+        if not self.running:
+            # Disconnected while the connection was being set up
+            sock.close()
+            return
+        self.socket = sock
+        logging.info(f"Connected to remote server at {self.host}:{self.port}")
+        get_reactor().register(sock, self.on_message, self.handle_closed)
+
+    def handle_closed(self):
+        self.running = False
+        self.socket.close()
+        logging.info("Remote client disconnected.")
+
+    def send_command(self, command):
+        """
+        Send a command (as a dictionary) to the remote server.
+        """
+        if self.socket:
+            try:
+                send_frame(self.socket, command)
+            except Exception as e:
+                logging.error(f"Error sending command to server: {e}")
+
+    def disconnect(self):
+        self.running = False
+        if self.socket:
+            # The reactor sees the shutdown as a disconnect and closes the socket
+            try:
+                self.socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def wait(self):
+        """Waits for a connection attempt in progress to finish."""
+        if self.connect_thread:
+            self.connect_thread.join()
@@ -0,0 +1,201 @@
+import struct
+import msgpack
+from core.utils import HEX_BYTE, format_id, format_timestamp
+
+# Every frame on the wire is a 4-byte big-endian payload length followed by a msgpack document
+HEADER = struct.Struct("!I")
+# Largest payload accepted from a peer; anything bigger means the stream is corrupt
+MAX_FRAME_SIZE = 1 << 20
+# "type" of a frame carrying monitor rows, packed into "packed" or listed in "rows"
+BATCH_TYPE = "batch"
+# Row types that have a one-byte code, in code order
+ROW_TYPES = ("Rx", "Tx")
+TYPE_CODES = {row_type: code for code, row_type in enumerate(ROW_TYPES)}
+# Packed monitor row: timestamp_ns, type code, arbitration ID, data length, data padded to 8 bytes
+PACKED_ROW = struct.Struct("<qBIB8s")
+
+
+# Monitor rows travel as (timestamp_ns, type, id, data) arrays: integer timestamp and ID,
+# raw data bytes. Arrays decode as tuples, so received rows are ready for the monitor model.
+def _dumps(obj) -> bytes:
+    return msgpack.packb(obj, use_bin_type=True)
+
+
+def _loads(payload):
+    return msgpack.unpackb(payload, raw=False, use_list=False)
+
+
+def encode_frame(obj) -> bytes:
+    """
+    Serializes a message or command into a length-prefixed frame.
+
+    Args:
+        obj (dict): The msgpack-serializable message.
+
+    Returns:
+        bytes: The frame, ready to be written to a socket.
+    """
+    payload = _dumps(obj)
+    return HEADER.pack(len(payload)) + payload
+
+
+def send_frame(sock, obj):
+    """Writes one framed message to a socket."""
+    sock.sendall(encode_frame(obj))
+
+
+def pack_rows(rows):
+    """
+    Packs monitor rows back to back in the fixed PACKED_ROW layout.
+
+    Args:
+        rows (list[tuple]): (timestamp_ns, type, id, data) rows.
+
+    Returns:
+        bytes | None: The packed rows, or None if any row doesn't fit the layout
+            (e.g. a preformatted row with string fields).
+    """
+    pack = PACKED_ROW.pack
+    type_codes = TYPE_CODES
+    packed = []
+    add = packed.append
+    try:
+        for timestamp, msg_type, msg_id, data in rows:
+            if len(data) > 8:
+                return None
+            add(pack(timestamp, type_codes[msg_type], msg_id, len(data), data))
+    except (KeyError, TypeError, struct.error):
+        return None
+    return b"".join(packed)
+
+
+def batch_frame(rows) -> dict:
+    """
+    Wraps monitor rows into one batch message, packed when every row fits PACKED_ROW.
+
+    Args:
+        rows (list[tuple]): (timestamp_ns, type, id, data) rows.
+    """
+    packed = pack_rows(rows)
+    if packed is None:
+        return {"type": BATCH_TYPE, "rows": rows}
+    return {"type": BATCH_TYPE, "packed": packed}
+
+
+def unpack_rows(msg) -> list:
+    """
+    Returns the monitor rows carried by a received message.
+
+    Args:
+        msg (dict): A batch, or a single message in the form produced by row_to_message.
+
+    Returns:
+        list[tuple]: (timestamp, type, id, data) rows, in order.
+    """
+    if msg.get("type") == BATCH_TYPE:
+        packed = msg.get("packed")
+        if packed is not None:
+            row_types = ROW_TYPES
+            return [
+                (timestamp, row_types[code], msg_id, data[:length])
+                for timestamp, code, msg_id, length, data in PACKED_ROW.iter_unpack(packed)
+            ]
+        return list(msg.get("rows", ()))
+    return [(msg.get("timestamp", ""), msg.get("type", ""), msg.get("id", ""), tuple(msg.get("data", ())))]
+
+
+def row_to_message(row) -> dict:
+    """Formats a monitor row as a readable message dict."""
+    timestamp, msg_type, msg_id, data = row
+    return {
+        "timestamp": format_timestamp(timestamp) if isinstance(timestamp, int) else timestamp,
+        "type": msg_type,
+        "id": format_id(msg_id) if isinstance(msg_id, int) else msg_id,
+        "data": [HEX_BYTE[b] if isinstance(b, int) else b for b in data],
+    }
+
+
+class FrameReader:
+    """
+    Reassembles framed messages from arbitrary chunks of a TCP stream, so
+    messages split across reads or packed into a single read both decode.
+    Bytes are received into one preallocated buffer that is reused for the
+    life of the connection, and payloads are decoded straight out of it.
+    """
+
+    def __init__(self, size: int = 65536) -> None:
+        self._buffer = bytearray(size)
+        self._view = memoryview(self._buffer)
+        # Bytes of the buffer currently holding received data
+        self._end = 0
+
+    def recv_from(self, sock):
+        """
+        Reads once from a socket into the buffer and returns every message completed by it.
+
+        Args:
+            sock (socket.socket): A readable socket.
+
+        Returns:
+            list[dict] | None: The decoded messages, in order, or None once the peer has closed.
+
+        Raises:
+            ValueError: If a frame is oversized or its payload is not valid msgpack.
+        """
+        if self._end == len(self._buffer):
+            # Full but no complete frame: it is larger than the buffer
+            self._grow(2 * len(self._buffer))
+        received = sock.recv_into(self._view[self._end:])
+        if not received:
+            return None
+        self._end += received
+        return self._parse()
+
+    def feed(self, data) -> list:
+        """
+        Adds received bytes and returns every message completed by them.
+
+        Args:
+            data (bytes): Bytes as returned by socket.recv.
+
+        Returns:
+            list[dict]: The decoded messages, in order.
+
+        Raises:
+            ValueError: If a frame is oversized or its payload is not valid msgpack.
+        """
+        needed = self._end + len(data)
+        if needed > len(self._buffer):
+            self._grow(max(needed, 2 * len(self._buffer)))
+        self._view[self._end:needed] = data
+        self._end = needed
+        return self._parse()
+
+    def _grow(self, size: int) -> None:
+        buffer = bytearray(size)
+        buffer[:self._end] = self._view[:self._end]
+        self._view.release()
+        self._buffer = buffer
+        self._view = memoryview(buffer)
+
+    def _parse(self) -> list:
+        view = self._view
+        end = self._end
+        messages = []
+        offset = 0
+        header_size = HEADER.size
+        while end - offset >= header_size:
+            (length,) = HEADER.unpack_from(view, offset)
+            if length > MAX_FRAME_SIZE:
+                raise ValueError(f"Frame of {length} bytes exceeds the {MAX_FRAME_SIZE} byte limit.")
+            frame_end = offset + header_size + length
+            if frame_end > end:
+                break
+            messages.append(_loads(view[offset + header_size:frame_end]))
+            offset = frame_end
+        if offset:
+            # Move the partial frame to the front; memoryview assignment handles the overlap
+            remaining = end - offset
+            view[:remaining] = view[offset:end]
+            self._end = remaining
+        return messages
@@ -0,0 +1,92 @@
+import ctypes
+import ctypes.util
+import errno
+import os
+
+
+class _IoVec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_IoVec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", _MsgHdr), ("msg_len", ctypes.c_uint)]
+
+
+def _load_recvmmsg():
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        recvmmsg = libc.recvmmsg
+    except (OSError, AttributeError):
+        return None
+    recvmmsg.argtypes = [ctypes.c_int, ctypes.POINTER(_MMsgHdr), ctypes.c_uint, ctypes.c_int, ctypes.c_void_p]
+    recvmmsg.restype = ctypes.c_int
+    return recvmmsg
+
+
+# None where libc has no recvmmsg (non-Linux); callers then fall back to one recv per frame
+_recvmmsg = _load_recvmmsg()
+
+
+class BatchReceiver:
+    """
+    Receives up to batch_size datagrams from a socket with a single recvmmsg call.
+    Datagram i lands at offset i * frame_size of one preallocated buffer, which is
+    reused for every call, so the caller unpacks frames in place.
+    """
+
+    def __init__(self, sock, frame_size: int, batch_size: int = 64) -> None:
+        self._fd = sock.fileno()
+        self.frame_size = frame_size
+        self.buffer = (ctypes.c_char * (frame_size * batch_size))()
+        self._iovecs = (_IoVec * batch_size)()
+        self._headers = (_MMsgHdr * batch_size)()
+        self._batch_size = batch_size
+        base = ctypes.addressof(self.buffer)
+        for i in range(batch_size):
+            self._iovecs[i].iov_base = base + i * frame_size
+            self._iovecs[i].iov_len = frame_size
+            self._headers[i].msg_hdr.msg_iov = ctypes.pointer(self._iovecs[i])
+            self._headers[i].msg_hdr.msg_iovlen = 1
+
+    @staticmethod
+    def available() -> bool:
+        """Returns whether recvmmsg can be used on this platform."""
+        return _recvmmsg is not None
+
+    def receive(self, flags: int = 0) -> int:
+        """
+        Receives the datagrams already queued on the socket, up to the batch size.
+
+        Args:
+            flags (int): recvmmsg flags, e.g. socket.MSG_DONTWAIT.
+
+        Returns:
+            int: The number of datagrams received.
+
+        Raises:
+            BlockingIOError: If MSG_DONTWAIT was given and nothing is queued.
+            OSError: If the call fails otherwise.
+        """
+        count = _recvmmsg(self._fd, self._headers, self._batch_size, flags, None)
+        if count < 0:
+            error = ctypes.get_errno()
+            if error in (errno.EAGAIN, errno.EWOULDBLOCK):
+                raise BlockingIOError(error, os.strerror(error))
+            raise OSError(error, os.strerror(error))
+        return count
+
+    def length(self, index: int) -> int:
+        """Returns the size of datagram index from the last receive."""
+        return self._headers[index].msg_len
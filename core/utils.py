@@ -1,6 +1,63 @@
+from datetime import datetime
+from functools import lru_cache
+
+# Precomputed hex() renderings for data bytes and standard 11-bit CAN IDs
+HEX_BYTE = tuple(hex(i) for i in range(0x100))
+HEX_ID = tuple(hex(i) for i in range(0x800))
+
+
+def format_id(message_id: int) -> str:
+    """
+    Renders a CAN arbitration ID like hex(), from the lookup table for standard
+    11-bit IDs; extended IDs fall back to hex().
+    """
+    return HEX_ID[message_id] if 0 <= message_id < 0x800 else hex(message_id)
+
+
+def format_timestamp(timestamp_ns: int) -> str:
+    """
+    Renders a time.time_ns() value like the main windows' get_current_timestamp,
+    with millisecond precision.
+    """
+    return datetime.fromtimestamp(timestamp_ns / 1e9).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+
+
+# Exact spellings of byte values as typed in the UI/CLI or produced by hex()
+_FAST_VALUES = {}
+for _i in range(0x100):
+    _FAST_VALUES[str(_i)] = _i
+    _FAST_VALUES[hex(_i)] = _i
+    _FAST_VALUES[f"0x{_i:02x}"] = _i
+    _FAST_VALUES[f"0x{_i:02X}"] = _i
+del _i
+
+
 def parse_value(value):
     """
     Parses a string value in hex, binary, or decimal format.
+    Common byte spellings are answered from a lookup table; anything else
+    goes through the memoized parser.
+
+    Args:
+        value (str): The value to parse.
+
+    Returns:
+        int: The parsed integer value.
+
+    Raises:
+        ValueError: If the format is invalid.
+    """
+    fast = _FAST_VALUES.get(value)
+    if fast is not None:
+        return fast
+    return _parse_value(value)
+
+
+@lru_cache(maxsize=4096)
+def _parse_value(value):
+    """
+    Parses a string value in hex, binary, or decimal format.
+    Results are memoized, since the same short strings recur constantly.
 
     Args:
         value (str): The value to parse.
@@ -17,4 +74,35 @@ def parse_value(value):
     elif value_lower.startswith("0b"):
         return int(value, 2)
     else:
-        return int(value)
\ No newline at end of file
+        return int(value)
+
+
+def parse_bytes(values) -> bytes:
+    """
+    Parses a sequence of data byte strings in hex, binary, or decimal format
+    and checks that each one fits in a byte.
+    When every value is a common byte spelling, the whole batch is answered
+    from the lookup table without any range checks.
+
+    Args:
+        values (Sequence[str]): The byte strings to parse.
+
+    Returns:
+        bytes: The parsed byte values.
+
+    Raises:
+        ValueError: If a value is malformed or outside 0..255.
+    """
+    lookup = _FAST_VALUES.get
+    # -1 marks a value that is not in the table
+    hits = [lookup(value, -1) for value in values]
+    if -1 not in hits:
+        return bytes(hits)
+    parsed = [fast if fast >= 0 else _parse_value(value) for fast, value in zip(hits, values)]
+    try:
+        # Packing into bytes range-checks every value in a single C-level pass
+        return bytes(parsed)
+    except ValueError:
+        invalid = next(i for i, b in enumerate(parsed) if b >> 8)
+        raise ValueError(f"Invalid Byte {invalid}: {parsed[invalid]}") from None
+
@@ -1,4 +1,19 @@
 from setuptools import setup, find_packages
+import os
+
+# Optional: compile the Qt-free hot paths (byte parsing, filter matching, message storage, remote framing)
+# to C extensions with mypyc. Enable with CAN_MONITOR_MYPYC=1; requires mypy.
+ext_modules = []
+if os.environ.get("CAN_MONITOR_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify([
+        "--ignore-missing-imports",
+        "core/utils.py",
+        "core/filter_manager.py",
+        "core/message_manager.py",
+        "core/remote_protocol.py",
+    ])
 
 setup(
     name="rpi-can-monitor",
@@ -9,9 +24,11 @@ setup(
     url="https://github.com/yourusername/rpi-can-monitor",
     packages=find_packages(),
     include_package_data=True,
+    ext_modules=ext_modules,
     install_requires=[
         "python-can>=4.1.0",
         "PyQt6>=6.4.0",
+        "msgpack>=1.0.0",
     ],
     extras_require={
         "modern": ["PySide6>=6.5.0"],
@@ -19,6 +36,7 @@ setup(
             "pytest>=7.0.0",
             "black>=22.0.0",
             "isort>=5.10.0",
+            "mypy>=1.8.0",
         ],
     },
     entry_points={
@@ -1,7 +1,7 @@
 import logging
+from datetime import datetime
 from PyQt6.QtWidgets import QMainWindow, QMessageBox, QLabel
 from PyQt6.uic import loadUi
-from PyQt6.QtCore import QTimer
 
 # Import the separated controllers
 from controllers.frameworks.pyqt.filter_controller import FilterController
@@ -24,11 +24,7 @@ class MainWindow(QMainWindow):
         self.can_controller = CANController(self)
         self.monitor_controller = MonitorController(self)
         self.remote_controller = RemoteController(self, self.can_controller.can_interface, self.monitor_controller)
-        
-        # Set up a timer for polling received messages
-        self.message_poll_timer = QTimer(self)
-        self.message_poll_timer.timeout.connect(self.monitor_controller.update_monitor_table)
-        self.message_poll_timer.start(100)
+        # The monitor controller polls for received messages on its own adaptive timer
         
         # Set initial CAN connection status
         self.update_status_indicator(False)
@@ -37,8 +33,10 @@ class MainWindow(QMainWindow):
 
     def update_status_indicator(self, connected: bool):
         """Updates the status indicator based on the connection state."""
-        # Look up the widget by its known type (QLabel) and object name ("ledCanStatus")
-        status_indicator: QLabel = self.findChild(QLabel, "ledCanStatus")
+        # Look up the widget by its known type (QLabel) and object name ("ledCanStatus") once
+        if not hasattr(self, "_status_indicator"):
+            self._status_indicator: QLabel = self.findChild(QLabel, "ledCanStatus")
+        status_indicator = self._status_indicator
         if not status_indicator:
             # Optionally, log or raise an error if the widget isn’t found.
             logging.error("Status indicator widget 'ledCanStatus' not found in UI.")
@@ -56,7 +54,6 @@ class MainWindow(QMainWindow):
 
     def get_current_timestamp(self) -> str:
         """Returns the current timestamp as a string."""
-        from datetime import datetime
         return datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
 
     def closeEvent(self, event):
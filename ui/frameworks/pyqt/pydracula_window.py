@@ -1,8 +1,12 @@
 import sys
 import os
 import logging
-from PyQt6.QtWidgets import QMainWindow, QApplication, QHeaderView, QMessageBox, QTableWidget, QTableWidgetItem, QLineEdit, QPushButton, QLabel
-from PyQt6.QtCore import QTimer, Qt
+from datetime import datetime
+from PyQt6.QtWidgets import (
+    QMainWindow, QApplication, QWidget, QTabWidget, QVBoxLayout, QHBoxLayout, QHeaderView,
+    QMessageBox, QTableView, QTableWidget, QLineEdit, QPushButton, QLabel,
+)
+from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QColor, QIcon
 
 # Import controllers using existing PyQt6 controllers
@@ -11,6 +15,8 @@ from controllers.frameworks.pyqt.message_controller import MessageController
 from controllers.frameworks.pyqt.can_controller import CANController
 from controllers.frameworks.pyqt.monitor_controller import MonitorController
 from controllers.frameworks.pyqt.remote_controller import RemoteController
+from core.can_interface import CANInterface
+from core.message_manager import MessageManager
 
 class PyQtPyDraculaWindow(QMainWindow):
     """
@@ -23,7 +29,6 @@ class PyQtPyDraculaWindow(QMainWindow):
         self.setGeometry(100, 100, 1200, 800)
         
         # Create a central widget
-        from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTabWidget
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
         
@@ -52,17 +57,14 @@ class PyQtPyDraculaWindow(QMainWindow):
         self.setup_can_tab()
         
         # Initialize controllers after UI setup
-        # We'll set up stub controllers without initializing widgets since we have a different UI
-        self.filter_controller = self.create_stub_filter_controller()
+        # The CAN and Monitor tabs reuse the classic UI object names, so the real filter and
+        # monitor controllers apply; the remaining controllers are stubs since the rest of the UI differs
+        self.filter_controller = FilterController(self)
         self.message_controller = self.create_stub_message_controller()
         self.can_controller = self.create_stub_can_controller() 
-        self.monitor_controller = self.create_stub_monitor_controller()
+        self.monitor_controller = MonitorController(self)
         self.remote_controller = RemoteController(self, self.can_controller.can_interface, self.monitor_controller)
-        
-        # Set up a timer for polling received messages
-        self.message_poll_timer = QTimer(self)
-        self.message_poll_timer.timeout.connect(self.monitor_controller.update_monitor_table)
-        self.message_poll_timer.start(100)
+        # The monitor controller polls for received messages on its own adaptive timer
         
         # Set initial CAN connection status
         self.update_status_indicator(False)
@@ -82,27 +84,21 @@ class PyQtPyDraculaWindow(QMainWindow):
         
     def get_current_timestamp(self) -> str:
         """Returns the current timestamp as a string."""
-        from datetime import datetime
         return datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
         
     def setup_monitor_tab(self):
         """Set up the monitor tab with necessary widgets."""
-        from PyQt6.QtWidgets import QVBoxLayout, QTableWidget, QHeaderView
         
         # Create layout
         layout = QVBoxLayout(self.monitor_tab)
         
-        # Create and add monitor table
-        self.table_monitor = QTableWidget()
+        # Create and add monitor table; MonitorController sets its model and headers
+        self.table_monitor = QTableView()
         self.table_monitor.setObjectName("tableMonitor")
-        self.table_monitor.setColumnCount(5)
-        self.table_monitor.setHorizontalHeaderLabels(["Timestamp", "Source", "ID", "Data", "Count"])
-        self.table_monitor.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)
         layout.addWidget(self.table_monitor)
     
     def setup_remote_tab(self):
         """Set up the remote tab with necessary widgets."""
-        from PyQt6.QtWidgets import QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton
         
         # Create layout
         layout = QVBoxLayout(self.remote_tab)
@@ -131,7 +127,6 @@ class PyQtPyDraculaWindow(QMainWindow):
     
     def setup_can_tab(self):
         """Set up the CAN tab with necessary widgets."""
-        from PyQt6.QtWidgets import QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QTableWidget, QHeaderView
         
         # Create layout
         layout = QVBoxLayout(self.can_tab)
@@ -193,95 +188,8 @@ class PyQtPyDraculaWindow(QMainWindow):
         
         layout.addLayout(filter_layout)
     
-    def create_stub_filter_controller(self):
-        """Create a stub filter controller with basic functionality."""
-        from core.filter_manager import FilterManager
-        
-        class StubFilterController:
-            def __init__(self, window):
-                self.main_window = window
-                self.filter_manager = FilterManager()
-                
-                # Connect buttons
-                if hasattr(window, 'button_add_filter'):
-                    window.button_add_filter.clicked.connect(self.handle_add_filter)
-                if hasattr(window, 'button_remove_filter'):
-                    window.button_remove_filter.clicked.connect(self.handle_remove_filter)
-                if hasattr(window, 'button_clear_filters'):
-                    window.button_clear_filters.clicked.connect(self.handle_clear_filters)
-                
-            def handle_add_filter(self):
-                """Add a filter using values from the UI inputs."""
-                if not hasattr(self.main_window, 'input_filter_id'):
-                    return
-                    
-                # Get filter ID
-                filter_id = self.main_window.input_filter_id.text().strip()
-                if not filter_id:
-                    self.main_window.show_error("Filter ID is required.")
-                    return
-                
-                # Create mask from byte inputs
-                mask = []
-                for i in range(8):
-                    byte_input = getattr(self.main_window, f'input_filter_byte{i}', None)
-                    if byte_input and byte_input.text().strip():
-                        try:
-                            mask.append(byte_input.text().strip())
-                        except:
-                            mask.append("0")
-                    else:
-                        mask.append("0")
-                
-                # Join mask into a space-separated string
-                mask_str = " ".join(mask)
-                
-                # Add the filter
-                if self.filter_manager.add_filter(filter_id, mask_str):
-                    logging.info(f"Filter added: ID={filter_id}, Mask={mask_str}")
-                    self.update_filters_table()
-                    
-                    # Clear inputs
-                    self.main_window.input_filter_id.clear()
-                    for i in range(8):
-                        byte_input = getattr(self.main_window, f'input_filter_byte{i}', None)
-                        if byte_input:
-                            byte_input.clear()
-                else:
-                    self.main_window.show_error("Failed to add filter (invalid format or duplicate)")
-                
-            def handle_remove_filter(self):
-                pass  # Implement filter removal later
-                
-            def handle_clear_filters(self):
-                self.filter_manager.clear_filters()
-                logging.info("All filters cleared.")
-                
-            def update_filters_table(self):
-                """Update the filters table with current filters."""
-                if not hasattr(self.main_window, 'table_filters'):
-                    return
-                    
-                table = self.main_window.table_filters
-                table.setRowCount(0)
-                
-                # Add current filters to the table
-                for i, f in enumerate(self.filter_manager.get_filters()):
-                    table.insertRow(i)
-                    
-                    # Add filter ID
-                    table.setItem(i, 0, QTableWidgetItem(str(f["id"])))
-                    
-                    # Add mask bytes
-                    for j, byte in enumerate(f["mask"]):
-                        if j < 8:  # Ensure we don't go out of bounds
-                            table.setItem(i, j+1, QTableWidgetItem(str(byte)))
-        
-        return StubFilterController(self)
-    
     def create_stub_message_controller(self):
         """Create a stub message controller with basic functionality."""
-        from core.message_manager import MessageManager
         
         class StubMessageController:
             def __init__(self, window):
@@ -295,7 +203,6 @@ class PyQtPyDraculaWindow(QMainWindow):
     
     def create_stub_can_controller(self):
         """Create a stub CAN controller with basic functionality."""
-        from core.can_interface import CANInterface
         
         class StubCANController:
             def __init__(self, window):
@@ -316,42 +223,3 @@ class PyQtPyDraculaWindow(QMainWindow):
                 pass  # Implement connection handling later
         
         return StubCANController(self)
-    
-    def create_stub_monitor_controller(self):
-        """Create a stub monitor controller with basic functionality."""
-        from core.message_manager import MessageManager
-        
-        class StubMonitorController:
-            def __init__(self, window):
-                self.main_window = window
-                self.message_manager = MessageManager()
-                self.last_message_count = 0
-                self.monitor_table = window.table_monitor if hasattr(window, 'table_monitor') else None
-                
-            def update_monitor_table(self):
-                # Simple implementation that can be improved later
-                if not self.monitor_table:
-                    return
-                    
-                messages = self.message_manager.get_messages()
-                if self.last_message_count != len(messages):
-                    self.monitor_table.setRowCount(0)
-                    for i, msg in enumerate(messages):
-                        self.monitor_table.insertRow(i)
-                        self.monitor_table.setItem(i, 0, QTableWidgetItem(msg["timestamp"]))
-                        self.monitor_table.setItem(i, 1, QTableWidgetItem(msg["source"]))
-                        self.monitor_table.setItem(i, 2, QTableWidgetItem(msg["id"]))
-                        self.monitor_table.setItem(i, 3, QTableWidgetItem(" ".join(msg["data"])))
-                        self.monitor_table.setItem(i, 4, QTableWidgetItem(str(msg["count"])))
-                    
-                    self.last_message_count = len(messages)
-                
-                # Mark messages as old - Since this method doesn't exist in MessageManager yet
-                # We'll skip it for now
-                pass
-                
-            def add_message(self, source, can_id, data):
-                timestamp = self.main_window.get_current_timestamp()
-                return self.message_manager.add_message(source, can_id, data, timestamp)
-        
-        return StubMonitorController(self)
\ No newline at end of file
@@ -1,6 +1,7 @@
 import sys
 import os
 import logging
+from datetime import datetime
 from PySide6.QtWidgets import QMainWindow, QApplication, QHeaderView, QMessageBox
 from PySide6.QtCore import QTimer, Qt
 from PySide6.QtGui import QIcon
@@ -155,7 +156,6 @@ class PyDraculaWindow(QMainWindow):
 
     def get_current_timestamp(self) -> str:
         """Returns the current timestamp as a string."""
-        from datetime import datetime
         return datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
 
     # RESIZE EVENTS